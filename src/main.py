@@ -4,11 +4,13 @@ Email Security Analysis Pipeline
 Main orchestrator that coordinates all analysis modules.
 """
 
+import atexit
 import logging
+import queue
 import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # Add project root to path
@@ -22,7 +24,7 @@ from src.modules.nlp_analyzer import NLPThreatAnalyzer
 from src.modules.spam_analyzer import SpamAnalyzer
 from src.utils.colors import Colors
 from src.utils.config import Config, ConfigurationError
-from src.utils.logging_utils import ColoredFormatter
+from src.utils.logging_utils import ColoredFormatter, InProcessQueueHandler
 from src.utils.metrics import Metrics
 from src.utils.sanitization import sanitize_for_logging
 from src.utils.structured_logging import JSONFormatter
@@ -94,6 +96,7 @@ class EmailSecurityPipeline:
         This is similar to how nginx can log JSON to files but show colored output to stdout.
         """
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        self._log_listener = None
 
         # Create logs directory if needed
         log_path = Path(self.config.system.log_file)
@@ -121,12 +124,37 @@ class EmailSecurityPipeline:
         stream_handler = logging.StreamHandler(sys.stdout)
         stream_handler.setFormatter(ColoredFormatter(log_format))
 
+        # basicConfig() is a no-op once the root logger has handlers (e.g. a
+        # second pipeline in the same process), so only start a listener
+        # when its queue handler will actually be installed.
+        if logging.root.handlers:
+            file_handler.close()
+            return
+
+        # PERFORMANCE: File writes (and rotation) happen on a background
+        # QueueListener thread, so analysis threads only pay for a queue put.
+        # The console stays synchronous to keep ordering with spinner output.
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._log_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        # Drain queued records to disk on interpreter exit
+        atexit.register(self._stop_log_listener)
+
         # Configure logging
         logging.basicConfig(
             level=getattr(logging, self.config.system.log_level.upper()),
-            handlers=[file_handler, stream_handler],
+            handlers=[InProcessQueueHandler(log_queue), stream_handler],
         )
 
+    def _stop_log_listener(self):
+        """Flush queued file records and stop the listener thread (idempotent)."""
+        listener = getattr(self, "_log_listener", None)
+        self._log_listener = None
+        if listener is not None:
+            listener.stop()
+
     def start(self):
         """Start the pipeline."""
         try:
@@ -221,6 +249,7 @@ class EmailSecurityPipeline:
                     )
             spinner.success("Pipeline stopped gracefully")
         self.logger.info("Pipeline stopped")
+        self._stop_log_listener()
 
     def _monitoring_loop(self):
         """Main monitoring loop."""
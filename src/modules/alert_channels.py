@@ -318,8 +318,11 @@ def build_webhook_payload(report: ThreatReport) -> Dict[str, Any]:
     ):
         urls = payload["spam_analysis"]["suspicious_urls"]
         if urls:
+            # ⚡ BOLT: suspicious_urls repeats a URL once per occurrence; parse
+            # and redact each unique URL once, then expand back in order.
+            redacted = {url: redact_sensitive_url_params(url) for url in set(urls)}
             payload["spam_analysis"]["suspicious_urls"] = [
-                redact_sensitive_url_params(url) for url in urls
+                redacted[url] for url in urls
             ]
 
     return payload
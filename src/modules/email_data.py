@@ -9,13 +9,16 @@ from email.message import Message
 from typing import Any, Dict, List, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailData:
     """
     Container for parsed email data.
 
     This dataclass holds all relevant information extracted from an email,
     including metadata, content, and attachments.
+
+    ⚡ BOLT: slots=True drops the per-instance __dict__; emails are created in
+    bulk on every fetch cycle, so this trims memory and speeds attribute access.
     """
 
     message_id: str
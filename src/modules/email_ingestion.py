@@ -15,11 +15,13 @@ PATTERN RECOGNITION: This follows the Facade pattern - it provides a simple
 interface to a complex subsystem (IMAP + parsing + security).
 """
 
+import asyncio
 import imaplib
 import logging
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from ..utils.config import EmailAccountConfig
 from ..utils.sanitization import redact_email, sanitize_for_logging
@@ -238,14 +240,17 @@ class IMAPClient:
         return self.connection_manager._fetch_emails_internal(folder, limit)
 
     def parse_email(
-        self, email_id: str, raw_email: bytes, folder: str
+        self,
+        email_id: str,
+        raw_email: Union[bytes, Iterable[bytes]],
+        folder: str,
     ) -> Optional[EmailData]:
         """
         Parse raw email into EmailData object.
 
         Args:
             email_id: Email ID
-            raw_email: Raw email bytes
+            raw_email: Raw email bytes or an iterable of byte chunks
             folder: Source folder
 
         Returns:
@@ -360,24 +365,25 @@ class EmailIngestionManager:
 
         """
         success_count = 0
-
-        for account in self.accounts:
-            if not account.enabled:
-                continue
-
-            client_config = EmailIngestionConfig(
-                rate_limit_delay=self.rate_limit_delay,
-                max_attachment_bytes=self.max_attachment_bytes,
-                max_total_attachment_bytes=self.max_total_attachment_bytes,
-                max_attachment_count=self.max_attachment_count,
-                max_body_size_bytes=self.max_body_size,
-                max_parallel_accounts=self.max_parallel_accounts,
-            )
-            client = IMAPClient(account, client_config)
-            client.max_body_size = self.max_body_size
-
-            if client.connect():
-                self.clients[account.email] = client
+        enabled = [account for account in self.accounts if account.enabled]
+        clients = [self._create_imap_client(account) for account in enabled]
+
+        # PERFORMANCE: Connect (TCP + TLS + LOGIN) to all accounts concurrently
+        # so start-up costs max(RTT) instead of sum(RTT) across providers.
+        # Results come back in account order, keeping self.clients ordered.
+        connected: List[bool] = []
+        if clients:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_parallel_accounts, len(clients)),
+                thread_name_prefix="EmailConnect",
+            ) as executor:
+                connected = list(executor.map(self._connect_client, enabled, clients))
+
+        for account, client, ok in zip(enabled, clients, connected):
+            if ok:
+                # Interned so lookups from parsed EmailData.account_email
+                # (interned by EmailParser) hit the identity fast path.
+                self.clients[sys.intern(account.email)] = client
                 success_count += 1
             else:
                 self.logger.error(f"Failed to connect to {redact_email(account.email)}")
@@ -389,6 +395,23 @@ class EmailIngestionManager:
         self.logger.info(f"Connected to {success_count}/{len(self.accounts)} accounts")
         return True
 
+    def _connect_client(self, account: EmailAccountConfig, client: IMAPClient) -> bool:
+        """
+        Connect one client, treating any exception as a failed connection.
+
+        executor.map() re-raises the first worker exception, which would
+        discard the accounts that already connected and leave their sessions
+        open but unregistered (and so never closed).
+        """
+        try:
+            return client.connect()
+        except Exception as exc:
+            # SECURITY: Per-account errors must not block other accounts.
+            self.logger.error(
+                f"Unexpected error connecting {redact_email(account.email)}: {exc}"
+            )
+            return False
+
     def _create_imap_client(self, account: EmailAccountConfig) -> IMAPClient:
         """Helper to create a fresh IMAP client matching manager settings."""
         client_config = EmailIngestionConfig(
@@ -514,11 +537,7 @@ class EmailIngestionManager:
             List of EmailData objects aggregated from all accounts
 
         """
-        active_accounts = [
-            account
-            for account in self.accounts
-            if account.enabled and account.email in self.clients
-        ]
+        active_accounts = self._active_accounts()
 
         if not active_accounts:
             self.logger.info("Fetched 0 emails total")
@@ -551,6 +570,66 @@ class EmailIngestionManager:
         self.logger.info(f"Fetched {len(all_emails)} emails total")
         return all_emails
 
+    async def afetch_all_emails(self, max_per_folder: int = 50) -> List[EmailData]:
+        """
+        Coroutine variant of fetch_all_emails for callers with an event loop.
+
+        Each account is processed via asyncio.to_thread and the results are
+        merged with asyncio.gather. A semaphore sized to max_parallel_accounts
+        provides the same backpressure as the thread pool in fetch_all_emails.
+
+        MAINTENANCE WISDOM: imaplib is blocking, so the IMAP work still runs
+        on worker threads; what this buys is letting an asyncio caller await
+        ingestion alongside other I/O instead of blocking its loop.
+
+        Args:
+            max_per_folder: Maximum emails to fetch per folder
+
+        Returns:
+            List of EmailData objects aggregated from all accounts
+
+        """
+        active_accounts = self._active_accounts()
+
+        if not active_accounts:
+            self.logger.info("Fetched 0 emails total")
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_parallel_accounts)
+
+        async def fetch_account(account: EmailAccountConfig) -> List[EmailData]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._process_account, account, max_per_folder
+                )
+
+        results = await asyncio.gather(
+            *(fetch_account(account) for account in active_accounts),
+            return_exceptions=True,
+        )
+
+        all_emails: List[EmailData] = []
+        for account, result in zip(active_accounts, results):
+            if isinstance(result, BaseException):
+                # SECURITY: Per-account errors must not block other accounts.
+                self.logger.error(
+                    f"Error processing account {redact_email(account.email)}: {result}",
+                    exc_info=result,
+                )
+                continue
+            all_emails.extend(result)
+
+        self.logger.info(f"Fetched {len(all_emails)} emails total")
+        return all_emails
+
+    def _active_accounts(self) -> List[EmailAccountConfig]:
+        """Return enabled accounts that have a connected client."""
+        return [
+            account
+            for account in self.accounts
+            if account.enabled and account.email in self.clients
+        ]
+
     def close_all_connections(self):
         """Close all IMAP connections."""
         for client in self.clients.values():
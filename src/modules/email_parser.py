@@ -14,16 +14,18 @@ SECURITY STORY: Email parsing is security-critical because emails can contain:
 This module enforces limits and sanitization at every step.
 """
 
-import email
+import codecs
 import logging
 import mimetypes
+import sys
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from email.header import decode_header, make_header
 from email.message import Message
+from email.parser import BytesFeedParser
 from email.utils import getaddresses, parsedate_to_datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from ..utils.config import EmailAccountConfig
 from ..utils.sanitization import sanitize_for_logging
@@ -35,8 +37,10 @@ from ..utils.security_validators import (
 from .email_data import EmailData
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseContext:
+    # ⚡ BOLT: One per parsed email; current_total_size is bumped per
+    # attachment, so slots keep those writes off a per-instance __dict__.
     safe_email_id: str
     body_dict: Dict[str, Any]
     attachments: List[Dict[str, Any]]
@@ -45,6 +49,15 @@ class ParseContext:
 
 logger = logging.getLogger(__name__)
 
+# Size of each slice handed to BytesFeedParser.feed(). 16 KiB keeps the
+# parser's internal line buffer small while amortising per-call overhead.
+PARSE_CHUNK_SIZE = 16 * 1024
+
+# Typical upper bound on encoded bytes per decoded character (UTF-8/16/32,
+# GB18030). Only sizes the chunks fed to the incremental decoder, so one
+# chunk usually yields max_body_size characters; it is not a hard limit.
+_BYTES_PER_CHAR_HINT = 8
+
 
 @dataclass
 class EmailParserConfig:
@@ -89,7 +102,10 @@ class EmailParser:
         self.logger = logging.getLogger(f"EmailParser.{config.provider}")
 
     def parse_email(
-        self, email_id: str, raw_email: bytes, folder: str
+        self,
+        email_id: str,
+        raw_email: Union[bytes, Iterable[bytes]],
+        folder: str,
     ) -> Optional[EmailData]:
         """
         Parse raw email into EmailData object.
@@ -99,7 +115,8 @@ class EmailParser:
 
         Args:
             email_id: Email identifier (sequence number from IMAP)
-            raw_email: Raw email bytes from IMAP server
+            raw_email: Raw email bytes from IMAP server, or an iterable of
+                byte chunks as they arrive off the wire
             folder: Source folder name
 
         Returns:
@@ -107,7 +124,7 @@ class EmailParser:
 
         """
         try:
-            msg = email.message_from_bytes(raw_email)
+            msg = self._parse_message(raw_email)
 
             # Extract and validate headers
             headers = self._extract_headers(msg)
@@ -121,6 +138,13 @@ class EmailParser:
             # Extract body and attachments
             body_text, body_html, attachments = self._extract_content(msg, email_id)
 
+            # ⚡ BOLT: Intern the account address so every EmailData from this
+            # account shares one string object; dict lookups keyed on it (e.g.
+            # EmailIngestionManager.clients) then short-circuit on identity.
+            account_email = self.config.email
+            if type(account_email) is str:
+                account_email = sys.intern(account_email)
+
             return EmailData(
                 message_id=msg.get("Message-ID", email_id),
                 subject=subject,
@@ -132,7 +156,7 @@ class EmailParser:
                 headers=headers,
                 attachments=attachments,
                 raw_email=msg,
-                account_email=self.config.email,
+                account_email=account_email,
                 folder=folder,
             )
 
@@ -141,6 +165,34 @@ class EmailParser:
             self.logger.error(f"Error parsing email {safe_email_id}: {e}")
             return None
 
+    @staticmethod
+    def _parse_message(raw_email: Union[bytes, Iterable[bytes]]) -> Message:
+        """
+        Build a Message by feeding the raw bytes through BytesFeedParser.
+
+        ⚡ BOLT: The feed parser is an incremental state machine, so chunks
+        can be handed over as they are read from the socket instead of
+        waiting for (and copying) the whole payload first. For a bytes
+        object we slice a memoryview, which avoids copying the message
+        before the parser sees it.
+
+        Args:
+            raw_email: Complete message bytes or an iterable of byte chunks
+
+        Returns:
+            Parsed email.message.Message (compat32 policy, same as
+            email.message_from_bytes)
+        """
+        parser = BytesFeedParser()
+        if isinstance(raw_email, (bytes, bytearray, memoryview)):
+            view = memoryview(raw_email)
+            for start in range(0, len(view), PARSE_CHUNK_SIZE):
+                parser.feed(bytes(view[start : start + PARSE_CHUNK_SIZE]))
+        else:
+            for chunk in raw_email:
+                parser.feed(chunk)
+        return parser.close()
+
     def _extract_headers(self, msg: Message) -> Dict[str, Union[str, List[str]]]:
         """
         Extract all headers from email, supporting duplicates.
@@ -320,7 +372,10 @@ class EmailParser:
         ctx: ParseContext,
     ) -> None:
         """Process a text/html body part in a multipart email."""
-        decoded_part = self._decode_part_payload(part)
+        max_chars = self._remaining_body_chars(content_type, ctx.body_dict)
+        if max_chars <= 0:
+            return
+        decoded_part = self._decode_part_payload(part, max_chars)
         self._add_body_content(
             content_type, decoded_part, ctx.body_dict, ctx.safe_email_id
         )
@@ -393,7 +448,11 @@ class EmailParser:
         try:
             payload = msg.get_payload(decode=True)
             if payload:
-                decoded = self._decode_bytes(payload, msg.get_content_charset())
+                decoded = self._decode_bytes(
+                    payload,
+                    msg.get_content_charset(),
+                    self._remaining_body_chars(content_type, ctx.body_dict),
+                )
                 self._add_body_content(
                     content_type, decoded, ctx.body_dict, ctx.safe_email_id
                 )
@@ -445,6 +504,13 @@ class EmailParser:
             parts.append(new_part)
             return parts, current_len + len(new_part)
 
+    def _remaining_body_chars(
+        self, content_type: str, body_dict: Dict[str, Any]
+    ) -> int:
+        """Return how many more characters of this body type fit max_body_size."""
+        key = "html" if content_type == "text/html" else "text"
+        return self.max_body_size - body_dict.get(f"{key}_len", 0)
+
     def _add_body_content(
         self,
         content_type: str,
@@ -658,12 +724,13 @@ class EmailParser:
         return ", ".join(addresses)
 
     @staticmethod
-    def _decode_part_payload(part: Message) -> str:
+    def _decode_part_payload(part: Message, max_chars: Optional[int] = None) -> str:
         """
         Decode MIME part payload to string.
 
         Args:
             part: MIME part
+            max_chars: Optional cap on characters the caller will keep
 
         Returns:
             Decoded string content
@@ -672,10 +739,14 @@ class EmailParser:
         payload = part.get_payload(decode=True)
         if not payload:
             return ""
-        return EmailParser._decode_bytes(payload, part.get_content_charset())
+        return EmailParser._decode_bytes(
+            payload, part.get_content_charset(), max_chars
+        )
 
     @staticmethod
-    def _decode_bytes(data: bytes, charset: Optional[str]) -> str:
+    def _decode_bytes(
+        data: bytes, charset: Optional[str], max_chars: Optional[int] = None
+    ) -> str:
         """
         Decode bytes to string with charset fallback.
 
@@ -686,6 +757,9 @@ class EmailParser:
         Args:
             data: Bytes to decode
             charset: Charset name (can be None or invalid)
+            max_chars: Optional cap on characters the caller will keep. Only
+                the byte prefix that can produce that many characters is
+                decoded; callers still truncate the result.
 
         Returns:
             Decoded string
@@ -693,7 +767,49 @@ class EmailParser:
         """
         encoding = charset or "utf-8"
         try:
-            return data.decode(encoding, errors="replace")
+            return EmailParser._decode_text(data, encoding, max_chars)
         except LookupError:
             # Unknown charset, fallback to UTF-8
-            return data.decode("utf-8", errors="replace")
+            return EmailParser._decode_text(data, "utf-8", max_chars)
+
+    @staticmethod
+    def _decode_text(data: bytes, encoding: str, max_chars: Optional[int]) -> str:
+        """
+        Decode with ``encoding``, stopping once ``max_chars`` characters exist.
+
+        ⚡ BOLT: Bodies are truncated to max_body_size after decoding, so a
+        20MB text part used to be fully decoded only to keep the first 1MB.
+        Feed an incremental decoder zero-copy chunks instead and stop as soon
+        as enough characters came out; the few extra characters are dropped
+        by _append_body_part.
+
+        SECURITY STORY: There is no fixed bytes-per-character bound to cut a
+        prefix by. Stateful charsets (ISO-2022-*, UTF-7) have escape
+        sequences that decode to zero characters, so padding could push the
+        real body past any such cut and hide it from analysis. Decoding
+        until max_chars characters are produced cannot be starved that way;
+        at worst it decodes the whole payload, as without the limit.
+
+        Raises:
+            LookupError: If ``encoding`` is unknown or not a text encoding
+
+        """
+        chunk_size = max(max_chars or 0, 1) * _BYTES_PER_CHAR_HINT
+        if max_chars is None or len(data) <= chunk_size:
+            return str(data, encoding, errors="replace")
+
+        # str() rejects non-text codecs (hex, base64, ...) with LookupError;
+        # the incremental decoder would not.
+        str(data[:1], encoding, errors="replace")
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        view = memoryview(data)
+        parts: List[str] = []
+        produced = 0
+        for start in range(0, len(data), chunk_size):
+            text = decoder.decode(view[start : start + chunk_size])
+            parts.append(text)
+            produced += len(text)
+            if produced >= max_chars:
+                return "".join(parts)
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
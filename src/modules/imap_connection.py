@@ -225,8 +225,9 @@ class IMAPConnection:
         Fetch unseen emails from folder with size validation.
 
         SECURITY STORY: We check email sizes BEFORE downloading them to
-        prevent DoS attacks from extremely large emails. We also process
-        in batches with rate limiting to avoid overwhelming the server.
+        prevent DoS attacks from extremely large emails. The unseen IDs are
+        capped at ``limit`` and fetched with one bounded FETCH, so a single
+        poll never asks the server for more than ``limit`` messages.
 
         Args:
             folder: Folder name
@@ -269,17 +270,11 @@ class IMAPConnection:
 
             self.logger.info(f"Found {len(email_ids)} unseen emails in {safe_folder}")
 
-            # Process in batches for rate limiting
-            emails = []
-            # Increased to 50 to minimize 0.5s sleep overhead per batch
-            batch_size = 50
-
-            for i in range(0, len(email_ids), batch_size):
-                batch_ids = email_ids[i : i + batch_size]
-                batch_emails = self._fetch_batch(batch_ids)
-                emails.extend(batch_emails)
-
-            return emails
+            # ⚡ BOLT: Issue a single size-check FETCH and a single body FETCH for
+            # the whole (already limit-capped) ID set. The server pipelines every
+            # message into one tagged response, so K unseen emails cost two
+            # round-trips instead of two per 50-message batch.
+            return self._fetch_batch(email_ids)
 
         except Exception as e:
             self.logger.error(f"Error in fetch_unseen_emails: {e}")
@@ -25,7 +25,7 @@ media_deepfake.cv2 = cv2
 FrameExtractionOptions = media_deepfake.FrameExtractionOptions
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaAnalysisResult:
     """Result of media analysis."""
 
@@ -382,8 +382,10 @@ class MediaAuthenticityAnalyzer:
         risk_level = self._calculate_risk_level(threat_score)
 
         self.logger.debug(
-            f"Media analysis complete: {len(email_data.attachments)} attachments, "
-            f"score={threat_score:.2f}, risk={risk_level}"
+            "Media analysis complete: %d attachments, score=%.2f, risk=%s",
+            len(email_data.attachments),
+            threat_score,
+            risk_level,
         )
 
         return MediaAnalysisResult(
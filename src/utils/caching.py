@@ -6,6 +6,8 @@ PATTERN RECOGNITION: This combines two complementary eviction policies:
     exceeds max_size, preventing unbounded memory growth in long-running daemons.
   - Time-based (TTL): lazily removes entries whose age exceeds ttl_seconds at
     the next access, preventing stale analysis results from persisting forever.
+    An expiry min-heap lets each access drop every expired entry in one sweep
+    instead of leaving them to be found key by key.
 
 SECURITY STORY: Callers should hash sensitive input before using it as a cache
 key so that raw user content (e.g., email body text) never appears in the key
@@ -16,9 +18,11 @@ so it can be reused safely across any module that needs bounded caching without
 importing the full project dependency tree.
 """
 
+import heapq
 import threading
 import time
-from typing import Any, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
 
 class TTLCache:
@@ -27,9 +31,10 @@ class TTLCache:
 
     Entries are evicted when:
     - The cache exceeds *max_size* — the oldest/least-recently-used entry is
-      removed first (insertion-order LRU via Python dict).
+      removed first (LRU order kept by an ``OrderedDict``).
     - An entry's age exceeds *ttl_seconds* — it is removed lazily on the next
-      ``get`` or ``__contains__`` call for that key.
+      ``get`` or ``__contains__`` call (all expired entries are swept at once
+      via a min-heap ordered by expiry time).
 
     Note: ``None`` values are not supported; ``get`` returns ``None`` to signal
     a cache miss (absent or expired).
@@ -37,19 +42,33 @@ class TTLCache:
     Args:
         max_size:    Maximum number of live entries (default 512).
         ttl_seconds: Seconds before an entry is considered stale (default 3600).
+        time_func:   Clock returning integer nanoseconds (default
+                     ``time.monotonic_ns``). Tests inject a fake clock here
+                     to drive expiry without sleeping.
 
     """
 
-    def __init__(self, max_size: int = 512, ttl_seconds: int = 3600) -> None:
+    def __init__(
+        self,
+        max_size: int = 512,
+        ttl_seconds: int = 3600,
+        time_func: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
         if max_size <= 0:
             raise ValueError(f"max_size must be a positive integer, got {max_size}")
         if ttl_seconds <= 0:
             raise ValueError(
                 f"ttl_seconds must be a positive integer, got {ttl_seconds}"
             )
-        self._store: dict = {}  # key -> (value, float)
+        # key -> (value, expires_at_ns), least-recently-used first
+        self._store: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        # (expires_at_ns, key); may hold stale items for keys that were
+        # overwritten or LRU-evicted — they are skipped when popped.
+        self._expiry_heap: List[Tuple[int, str]] = []
         self._max_size = max_size
-        self._ttl = float(ttl_seconds)
+        # Integer nanoseconds: monotonic_ns() avoids float rounding on compare
+        self._ttl_ns = int(ttl_seconds * 1_000_000_000)
+        self._time_func = time_func
         self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
@@ -74,20 +93,27 @@ class TTLCache:
         Re-inserting an existing key promotes it to most-recently-used.
         """
         with self._lock:
-            # Remove first so re-insertion places the key at the tail (newest)
-            self._store.pop(key, None)
-            self._store[key] = (value, time.monotonic())
-            # Evict oldest entries until we are within the size budget
-            while len(self._store) > self._max_size:
-                try:
-                    self._store.pop(next(iter(self._store)))
-                except (StopIteration, KeyError):  # pragma: no cover
-                    break
+            self._put_locked(key, value, self._time_func() + self._ttl_ns)
+            self._enforce_limits_locked()
+
+    def put_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Store several ``(key, value)`` pairs under a single lock acquisition.
+
+        Equivalent to calling :meth:`put` for each pair in order, but size
+        eviction and heap maintenance run once for the whole batch.
+        """
+        with self._lock:
+            expires_at = self._time_func() + self._ttl_ns
+            for key, value in items:
+                self._put_locked(key, value, expires_at)
+            self._enforce_limits_locked()
 
     def clear(self) -> None:
         """Remove all entries."""
         with self._lock:
             self._store.clear()
+            self._expiry_heap.clear()
 
     # ------------------------------------------------------------------
     # Read-only dict-compatibility helpers (used by tests / introspection)
@@ -103,22 +129,51 @@ class TTLCache:
 
     def keys(self) -> List[str]:
         """Return non-expired keys in LRU order (oldest first, newest last)."""
-        now = time.monotonic()
+        now = self._time_func()
         with self._lock:
-            return [k for k, (_, ts) in self._store.items() if now - ts < self._ttl]
+            return [k for k, (_, exp) in self._store.items() if exp > now]
 
     # ------------------------------------------------------------------
-    # Private helper (must be called with _lock already held)
+    # Private helpers (must be called with _lock already held)
     # ------------------------------------------------------------------
 
+    def _put_locked(self, key: str, value: Any, expires_at: int) -> None:
+        self._store[key] = (value, expires_at)
+        # Re-inserting an existing key keeps its old slot; move it to the
+        # tail (newest). move_to_end is a C-level relink, not pop + set.
+        self._store.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+    def _enforce_limits_locked(self) -> None:
+        # Evict oldest entries until we are within the size budget
+        while len(self._store) > self._max_size:
+            self._store.popitem(last=False)
+        # Stale heap items accumulate from overwrites and LRU evictions;
+        # rebuild from the live entries once they dominate the heap.
+        if len(self._expiry_heap) > 2 * self._max_size:
+            self._expiry_heap = [(exp, k) for k, (_, exp) in self._store.items()]
+            heapq.heapify(self._expiry_heap)
+
     def _get_locked(self, key: str) -> Optional[Any]:
-        if key not in self._store:
+        now = self._time_func()
+        self._purge_expired_locked(now)
+        entry = self._store.get(key)
+        if entry is None:
             return None
-        value, timestamp = self._store[key]
-        if time.monotonic() - timestamp >= self._ttl:
+        value, expires_at = entry
+        if expires_at <= now:  # pragma: no cover - purge normally handles it
             del self._store[key]  # Lazy TTL eviction
             return None
         # Promote to most-recently-used by moving to the tail of the dict
-        del self._store[key]
-        self._store[key] = (value, timestamp)
+        self._store.move_to_end(key)
         return value
+
+    def _purge_expired_locked(self, now: int) -> None:
+        """Pop every expired entry off the expiry heap and drop it."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            # Only evict if this heap item still describes the live entry
+            if entry is not None and entry[1] == expires_at:
+                del self._store[key]
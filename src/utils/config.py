@@ -76,6 +76,10 @@ class AnalysisConfig:
     # Global NLP / ML toggle (applies across analysis layers, not just media)
     enable_ml_model: bool = True
 
+    # Skip body/URL spam checks once headers, subject and sender already
+    # score in the "high" tier (faster, but the report omits those findings)
+    spam_early_exit: bool = False
+
 
 @dataclass
 class AlertConfig:
@@ -181,6 +185,7 @@ class Config:
             spam_threshold=float(os.getenv("SPAM_THRESHOLD", "5.0")),
             spam_check_headers=self._get_bool("SPAM_CHECK_HEADERS", True),
             spam_check_urls=self._get_bool("SPAM_CHECK_URLS", True),
+            spam_early_exit=self._get_bool("SPAM_EARLY_EXIT", False),
             nlp_model=os.getenv("NLP_MODEL", "distilbert-base-uncased"),
             nlp_model_revision=os.getenv(
                 "NLP_MODEL_REVISION", "959d503e255357cfddd5026befbca649f54b6bfd"
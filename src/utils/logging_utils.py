@@ -1,5 +1,6 @@
 import copy
 import logging
+from logging.handlers import QueueHandler
 
 from src.utils.colors import Colors
 
@@ -60,3 +61,21 @@ class ColoredFormatter(logging.Formatter):
             return Colors.colorize(msg_str, Colors.GREEN)
 
         return msg_str
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler for a same-process QueueListener that keeps exception info.
+
+    The stock ``prepare()`` pre-formats the record and drops ``exc_info`` so it
+    can be pickled across processes. Our listener runs in a thread of the same
+    process, so we only freeze the message (args may be mutated after the call
+    returns) and leave ``exc_info`` for the file formatter; JSONFormatter
+    still emits tracebacks in its dedicated ``exception`` field.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
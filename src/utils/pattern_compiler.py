@@ -14,7 +14,8 @@ these helpers so that the ReDoS guard and flag defaults are always applied unifo
 """
 
 import re
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
 
 _REDOS_SIGNATURES: List[str] = [
     r"(\w+)*",
@@ -28,10 +29,23 @@ Known ReDoS signatures — nested or repeated quantifiers on unbounded character
 classes are the most common source of catastrophic backtracking.
 """
 
-_REDOS_REGEX = re.compile("|".join(map(re.escape, _REDOS_SIGNATURES)))
+_NESTED_QUANTIFIER = r"\((?:[^()\\]|\\.)*[+*]\)(?:[+*]|\{\d*,\})"
+"""
+Generalized signature: a group whose last element carries an unbounded
+quantifier (``+``/``*``) that is itself repeated without an upper bound, e.g.
+``(\\w+\\s*)+`` or ``(x+){2,}``. Bounded repeats such as ``(\\w+){2}`` or
+``(x+){0,1}`` are allowed. Escaped characters are consumed in pairs so
+``(a\\+)+`` is not flagged.
+"""
+
+# ⚡ BOLT: One meta-regex covering the literal signatures and the generalized
+# nested-quantifier shape, so each check is a single C-level search.
+_REDOS_REGEX = re.compile(
+    "|".join([*map(re.escape, _REDOS_SIGNATURES), _NESTED_QUANTIFIER])
+)
 
 
-def check_redos_safety(patterns: List[str]) -> None:
+def check_redos_safety(patterns: Sequence[str]) -> None:
     """
     Raise ValueError if any pattern contains a known ReDoS signature.
 
@@ -55,6 +69,12 @@ def check_redos_safety(patterns: List[str]) -> None:
         ValueError: If any pattern contains a known ReDoS signature.
 
     """
+    # Optimization: Scan all patterns in one pass over a newline-joined
+    # string as a prefilter. It may false-positive (_NESTED_QUANTIFIER's
+    # [^()\\] also matches "\n", so a hit can span two patterns), which is
+    # why every hit is confirmed pattern by pattern before raising.
+    if not _REDOS_REGEX.search("\n".join(patterns)):
+        return
     for pattern in patterns:
         if _REDOS_REGEX.search(pattern):
             raise ValueError(f"Potential ReDoS in pattern: {pattern!r}")
@@ -85,6 +105,16 @@ def compile_patterns(
         A compiled :class:`re.Pattern` that matches any of the supplied patterns.
 
     """
+    return _compile_patterns_cached(tuple(patterns), flags, validate_redos)
+
+
+# ⚡ BOLT: Analyzers are constructed repeatedly (per worker, per test) with the
+# same pattern lists. Caching on the tuple of patterns skips the ReDoS scan,
+# the join and re's own cache lookup of a very long combined pattern string.
+@lru_cache(maxsize=128)
+def _compile_patterns_cached(
+    patterns: Tuple[str, ...], flags: int, validate_redos: bool
+) -> re.Pattern:
     if validate_redos:
         check_redos_safety(patterns)
     if not patterns:
@@ -120,6 +150,17 @@ def compile_named_group_pattern(
         generated group name to its original pattern string.
 
     """
+    compiled, group_map = _compile_named_group_pattern_cached(
+        tuple(patterns), flags, group_prefix, validate_redos
+    )
+    # Copy so callers mutating their map cannot corrupt the cached entry
+    return compiled, dict(group_map)
+
+
+@lru_cache(maxsize=128)
+def _compile_named_group_pattern_cached(
+    patterns: Tuple[str, ...], flags: int, group_prefix: str, validate_redos: bool
+) -> Tuple[re.Pattern, Dict[str, str]]:
     if validate_redos:
         check_redos_safety(patterns)
     if not patterns:
@@ -10,9 +10,6 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 
 def test_config_loading():
     """Test that configuration loads correctly."""
@@ -0,0 +1,22 @@
+"""Shared analyzer configuration stub for NLP analyzer tests."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class MockConfig:
+    """
+    Immutable stand-in for the NLP analysis config section.
+
+    Slotted and frozen so each test's analyzer reads a fixed-layout object
+    and no test can leak a mutated setting into another.
+    """
+
+    check_social_engineering: bool = True
+    check_urgency_markers: bool = True
+    check_authority_impersonation: bool = True
+    check_psychological_triggers: bool = True
+    nlp_threshold: float = 0.5
+    nlp_model: str = "distilbert-base-uncased"
+    nlp_model_revision: str = "main"
+    enable_ml_model: bool = True
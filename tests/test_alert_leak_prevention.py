@@ -1,6 +1,10 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from src.modules.alert_channels import (
+    build_webhook_payload,
+    redact_sensitive_url_params,
+)
 from src.modules.alert_system import AlertSystem, ThreatReport
 from src.utils.config import AlertConfig
 
@@ -68,6 +72,36 @@ class TestAlertSystemLeak(unittest.TestCase):
             self.assertNotIn("super_secret_password", suspicious_urls[0])
             self.assertNotIn("12345", suspicious_urls[0])
 
+    def test_webhook_redacts_each_unique_url_once(self):
+        sensitive_url = "https://evil.com/login?token=12345"
+        safe_url = "https://example.com/page"
+        report = ThreatReport(
+            email_id="1",
+            subject="Test",
+            sender="bad@evil.com",
+            recipient="me@example.com",
+            date="2023-01-01",
+            overall_threat_score=50,
+            risk_level="high",
+            spam_analysis={"suspicious_urls": [sensitive_url, safe_url] * 500},
+            nlp_analysis={},
+            media_analysis={},
+            recommendations=[],
+            timestamp="2023-01-01",
+        )
+
+        with patch(
+            "src.modules.alert_channels.redact_sensitive_url_params",
+            wraps=redact_sensitive_url_params,
+        ) as mock_redact:
+            payload = build_webhook_payload(report)
+
+        self.assertEqual(mock_redact.call_count, 2)
+        suspicious_urls = payload["spam_analysis"]["suspicious_urls"]
+        self.assertEqual(len(suspicious_urls), 1000)
+        self.assertNotIn("12345", suspicious_urls[0])
+        self.assertEqual(suspicious_urls[1::2], [safe_url] * 500)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,7 +12,7 @@ class TestTTLCache(unittest.TestCase):
         """Test TTLCache initialization with valid parameters."""
         cache = TTLCache(max_size=100, ttl_seconds=60)
         self.assertEqual(cache._max_size, 100)
-        self.assertEqual(cache._ttl, 60.0)
+        self.assertEqual(cache._ttl_ns, 60_000_000_000)
 
     def test_initialization_invalid(self):
         """Test TTLCache initialization with invalid parameters."""
@@ -97,6 +97,47 @@ class TestTTLCache(unittest.TestCase):
         self.assertIsNone(cache.get("k"))
         self.assertEqual(len(cache), 0)
 
+    def test_injected_clock_drives_expiry(self):
+        """A caller-supplied time_func controls expiry without real sleeps."""
+        now = [0]
+        cache = TTLCache(max_size=10, ttl_seconds=5, time_func=lambda: now[0])
+        cache.put("k", "v")
+
+        now[0] = 4_999_999_999
+        self.assertEqual(cache.get("k"), "v")
+        now[0] = 5_000_000_000
+        self.assertIsNone(cache.get("k"))
+
+    def test_expired_entries_swept_in_bulk(self):
+        """One access after expiry drops every expired entry, not just its key."""
+        now = [0]
+        cache = TTLCache(max_size=10, ttl_seconds=5, time_func=lambda: now[0])
+        for i in range(5):
+            cache.put(f"k{i}", i)
+        now[0] = 5_000_000_000
+        cache.put("fresh", "v")
+
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("fresh"), "v")
+
+    def test_expiry_heap_stays_bounded(self):
+        """Overwrites and evictions must not grow the expiry heap without bound."""
+        cache = TTLCache(max_size=4, ttl_seconds=60)
+        for i in range(100):
+            cache.put(f"k{i % 6}", i)
+        self.assertLessEqual(len(cache._expiry_heap), 2 * 4 + 1)
+
+    def test_put_many_matches_sequential_puts(self):
+        """Bulk insert keeps order, promotes re-inserted keys and evicts LRU."""
+        cache = TTLCache(max_size=3, ttl_seconds=60)
+        cache.put("a", 0)
+        cache.put_many([("b", 1), ("c", 2), ("a", 3), ("d", 4)])
+
+        self.assertEqual(cache.keys(), ["c", "a", "d"])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 3)
+
     def test_keys_filtering(self):
         """Test keys() filtering."""
         cache = TTLCache(max_size=10, ttl_seconds=0.1)
@@ -13,6 +13,7 @@ rather than going completely blind.
 """
 
 import sys
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -130,6 +131,35 @@ class TestEmailIngestionManagerInitialize(unittest.TestCase):
         self.assertIn("on@x.com", manager.clients)
         self.assertNotIn("off@x.com", manager.clients)
 
+    @patch("src.modules.email_ingestion.IMAPClient")
+    def test_accounts_connect_concurrently(self, MockClient):
+        """Connects overlap: each waits on a barrier only the other can release."""
+        barrier = threading.Barrier(2, timeout=5)
+        MockClient.return_value.connect.side_effect = lambda: barrier.wait() >= 0
+
+        accounts = [_make_account("a@x.com"), _make_account("b@x.com")]
+        manager = EmailIngestionManager(accounts)
+        manager.logger = MagicMock()
+
+        self.assertTrue(manager.initialize_clients())
+        self.assertEqual(list(manager.clients), ["a@x.com", "b@x.com"])
+
+    @patch("src.modules.email_ingestion.IMAPClient")
+    def test_unexpected_connect_error_keeps_other_accounts(self, MockClient):
+        """One account raising in connect() must not discard the others."""
+        good, bad = MagicMock(), MagicMock()
+        good.connect.return_value = True
+        bad.connect.side_effect = RuntimeError("boom")
+        MockClient.side_effect = [bad, good]
+
+        accounts = [_make_account("bad@x.com"), _make_account("good@x.com")]
+        manager = EmailIngestionManager(accounts)
+        manager.logger = MagicMock()
+
+        self.assertTrue(manager.initialize_clients())
+        self.assertEqual(list(manager.clients), ["good@x.com"])
+        manager.logger.error.assert_called()
+
 
 class TestEmailIngestionManagerFetch(unittest.TestCase):
     """Tests for fetch_all_emails()."""
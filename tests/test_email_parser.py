@@ -18,7 +18,11 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from unittest.mock import MagicMock, patch
 
-from src.modules.email_parser import EmailParser, EmailParserConfig
+from src.modules.email_parser import (
+    PARSE_CHUNK_SIZE,
+    EmailParser,
+    EmailParserConfig,
+)
 from src.utils.config import EmailAccountConfig
 from src.utils.security_validators import MAX_MIME_PARTS, MAX_SUBJECT_LENGTH
 
@@ -479,6 +483,48 @@ class TestEncodingFallbacks(unittest.TestCase):
         # The replacement character U+FFFD should appear
         self.assertIn("\ufffd", result)
 
+    def test_decode_bytes_max_chars_keeps_prefix(self):
+        """A max_chars cap decodes a prefix that still covers the kept text."""
+        data = ("é" * 1000).encode("utf-8")
+        result = EmailParser._decode_bytes(data, "utf-8", max_chars=10)
+        self.assertTrue(result.startswith("é" * 10))
+        self.assertLess(len(result), 1000)
+
+    def test_oversized_body_truncated_identically(self):
+        """Bounded decoding must not change the truncated body text."""
+        parser = _make_parser(max_body_size=100)
+        parser.logger = MagicMock()
+        body = "ü€" * 5000
+        raw = MIMEText(body, "plain", "utf-8").as_bytes()
+
+        result = parser.parse_email("enc-big", raw, "INBOX")
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.body_text, body[:100])
+
+    def test_stateful_charset_padding_cannot_hide_body(self):
+        """ISO-2022 escapes decode to nothing, so padding must not starve the cap."""
+        parser = _make_parser(max_body_size=100)
+        parser.logger = MagicMock()
+        payload = b"\x1b(B" * 400 + b"verify your account now http://evil.example/x"
+        raw = (
+            b"From: a@example.com\r\nTo: b@example.com\r\nSubject: hi\r\n"
+            b"MIME-Version: 1.0\r\n"
+            b"Content-Type: text/plain; charset=iso-2022-jp\r\n"
+            b"Content-Transfer-Encoding: 7bit\r\n\r\n" + payload
+        )
+
+        result = parser.parse_email("iso-pad", raw, "INBOX")
+
+        self.assertIsNotNone(result)
+        self.assertIn("verify your account now", result.body_text)
+
+    def test_decode_bytes_max_chars_rejects_non_text_codec(self):
+        """Non-text codecs fall back to UTF-8 on the incremental path too."""
+        data = b"plain ascii text " * 100
+        result = EmailParser._decode_bytes(data, "hex", max_chars=10)
+        self.assertTrue(result.startswith("plain ascii"))
+
     # -- _decode_header_value (static method) --------------------------------
 
     def test_header_decoding_plain_ascii(self):
@@ -721,6 +767,25 @@ class TestGeneralParsing(unittest.TestCase):
         self.assertGreaterEqual(result.date, before)
         self.assertLessEqual(result.date, after)
 
+    def test_chunked_input_matches_bytes_input(self):
+        """Feeding byte chunks must produce the same EmailData as whole bytes."""
+        msg = MIMEMultipart()
+        msg["Subject"] = "Chunked"
+        msg["From"] = "s@example.com"
+        msg.attach(MIMEText("line\n" * 20000, "plain"))
+        raw = msg.as_bytes()
+        self.assertGreater(len(raw), PARSE_CHUNK_SIZE)
+
+        whole = self.parser.parse_email("005", raw, "INBOX")
+        chunks = (raw[i : i + 1000] for i in range(0, len(raw), 1000))
+        streamed = self.parser.parse_email("005", chunks, "INBOX")
+
+        self.assertIsNotNone(whole)
+        self.assertIsNotNone(streamed)
+        self.assertEqual(streamed.subject, whole.subject)
+        self.assertEqual(streamed.headers, whole.headers)
+        self.assertEqual(streamed.body_text, whole.body_text)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -112,3 +113,23 @@ def test_spf_fail_mixed(spam_analyzer):
 
     assert "SPF check failed" in result.header_issues
     assert result.score >= 2.0
+
+
+def test_header_checks_honour_instance_overrides(spam_analyzer):
+    # Checks are looked up by name, so patching one method takes effect
+    headers = {
+        "from": "sender@example.com",
+        "to": "recipient@example.com",
+        "date": "...",
+        "message-id": "...",
+        "dkim-signature": "pass",
+    }
+
+    with patch.object(
+        spam_analyzer, "_check_forged_sender", return_value=(3.0, ["Patched check"])
+    ) as mock_check:
+        score, issues = spam_analyzer._analyze_headers(headers)
+
+    mock_check.assert_called_once_with(headers)
+    assert issues == ["Patched check"]
+    assert score == 3.0
@@ -626,5 +626,38 @@ class TestIMAPConnectionFetchBatch(unittest.TestCase):
         self.conn.logger.error.assert_called()
 
 
+class TestIMAPConnectionFetchRoundTrips(unittest.TestCase):
+    """Tests for the round-trip count of IMAPConnection._fetch_emails_internal()."""
+
+    def setUp(self):
+        self.config = _make_config()
+        self.conn = IMAPConnection(self.config)
+        self.conn.logger = MagicMock()
+
+    def test_all_ids_fetched_in_single_round_trip(self):
+        """
+        Every unseen ID (up to the limit) must be size-checked and downloaded
+        with one FETCH each, regardless of how many messages are pending.
+        """
+        ids = [str(i).encode() for i in range(1, 121)]
+        mock_imap = MagicMock()
+        mock_imap.search.return_value = ("OK", [b" ".join(ids)])
+
+        def fetch_side_effect(id_set, message_parts):
+            if message_parts == "(RFC822.SIZE)":
+                return "OK", [i + b" (RFC822.SIZE 100)" for i in id_set.split(b",")]
+            return "OK", [
+                (i + b" (RFC822 {3})", b"raw") for i in id_set.split(b",")
+            ]
+
+        mock_imap.fetch.side_effect = fetch_side_effect
+        self.conn.connection = mock_imap
+
+        result = self.conn._fetch_emails_internal("INBOX", limit=120)
+
+        self.assertEqual(len(result), 120)
+        self.assertEqual(mock_imap.fetch.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,4 @@
-"""Tests for ColoredFormatter in src/utils/logging_utils.
+"""Tests for ColoredFormatter and InProcessQueueHandler in src/utils/logging_utils.
 
 SECURITY STORY: ColoredFormatter applies ANSI codes to every log record
 emitted by the pipeline. A broken formatter can silently swallow or corrupt
@@ -10,6 +10,8 @@ regression is caught before it reaches production.
 import importlib
 import logging
 import os
+import queue
+import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -250,5 +252,30 @@ class TestColoredFormatter(unittest.TestCase):
         self.assertIn(C.GREY, output)
 
 
+class TestInProcessQueueHandler(unittest.TestCase):
+    """Unit tests for InProcessQueueHandler."""
+
+    def test_prepare_freezes_message_and_keeps_exc_info(self):
+        """Args are merged eagerly; exc_info survives for the file formatter."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        payload = ["before"]
+        record = logging.LogRecord(
+            "test", logging.ERROR, __file__, 1, "value=%s", (payload,), exc_info
+        )
+
+        log_queue = queue.SimpleQueue()
+        logging_utils.InProcessQueueHandler(log_queue).handle(record)
+        payload.append("after")
+        queued = log_queue.get_nowait()
+
+        self.assertEqual(queued.getMessage(), "value=['before']")
+        self.assertIsNone(queued.args)
+        self.assertIs(queued.exc_info, exc_info)
+        self.assertIsNot(queued, record)
+
+
 if __name__ == "__main__":
     unittest.main()
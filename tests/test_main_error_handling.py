@@ -1,3 +1,4 @@
+import logging
 import sys
 import unittest
 from pathlib import Path
@@ -127,6 +128,39 @@ class TestMainErrorHandling(unittest.TestCase):
             pipeline.stop.assert_called_once()
             mock_exit.assert_called_once_with(1)
 
+    def test_log_listener_started_once_and_stopped_on_shutdown(self):
+        """Only the pipeline that installs the root handlers owns a listener."""
+        with patch("src.main.Config") as mock_config, patch(
+            "src.main.EmailIngestionManager"
+        ), patch("src.main.SpamAnalyzer"), patch("src.main.NLPThreatAnalyzer"), patch(
+            "src.main.MediaAuthenticityAnalyzer"
+        ), patch(
+            "src.main.AlertSystem"
+        ), patch(
+            "src.main.RotatingFileHandler"
+        ), patch(
+            "src.main.QueueListener"
+        ) as mock_listener, patch(
+            "src.main.atexit.register"
+        ), patch.object(
+            logging.root, "handlers", []
+        ):
+            mock_config_instance = mock_config.return_value
+            mock_config_instance.system.log_file = "logs/test.log"
+            mock_config_instance.system.log_level = "INFO"
+            mock_config_instance.system.log_format = "text"
+
+            first = EmailSecurityPipeline(".env")
+            second = EmailSecurityPipeline(".env")
+
+            mock_listener.assert_called_once()
+            self.assertIsNone(second._log_listener)
+
+            first.logger = MagicMock()
+            first.stop()
+            first.stop()
+            mock_listener.return_value.stop.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ Multi-Account Processing Tests
 Tests concurrent account processing, isolation, and rate limiting.
 """
 
+import asyncio
 import sys
 import time
 import unittest
@@ -196,7 +197,7 @@ class TestMultiAccountProcessing(unittest.TestCase):
             body_html="",
             headers={},
             attachments=[],
-            raw_email=MagicMock(),
+            raw_email=b"",
             account_email="user1@example.com",  # Tagged with account1
             folder="INBOX",
         )
@@ -211,7 +212,7 @@ class TestMultiAccountProcessing(unittest.TestCase):
             body_html="",
             headers={},
             attachments=[],
-            raw_email=MagicMock(),
+            raw_email=b"",
             account_email="user2@different.com",  # Tagged with account2
             folder="INBOX",
         )
@@ -314,7 +315,7 @@ class TestMultiAccountProcessing(unittest.TestCase):
                 body_html="",
                 headers={},
                 attachments=[],
-                raw_email=MagicMock(),
+                raw_email=b"",
                 account_email="user1@example.com",
                 folder="INBOX",
             )
@@ -408,7 +409,7 @@ class TestMultiAccountProcessing(unittest.TestCase):
                 body_html="",
                 headers={},
                 attachments=[],
-                raw_email=MagicMock(),
+                raw_email=b"",
                 account_email="user1@example.com",
                 folder="INBOX",
             )
@@ -593,6 +594,29 @@ class TestParallelAccountProcessing(unittest.TestCase):
         # Error for the bad account was logged
         manager.logger.error.assert_called()
 
+    def test_afetch_all_emails_gathers_accounts_and_isolates_errors(self):
+        """
+        The coroutine variant aggregates every healthy account and, like the
+        threaded path, logs a failing account instead of raising.
+        """
+        accounts = [self._make_account(f"u{i}@x.com") for i in range(3)]
+        manager = EmailIngestionManager(
+            accounts, config=EmailIngestionConfig(max_parallel_accounts=2)
+        )
+        manager.logger = MagicMock()
+        manager.clients = {a.email: MagicMock() for a in accounts}
+
+        def process_side_effect(account, max_per_folder):
+            if account.email == "u1@x.com":
+                raise ConnectionError("IMAP server unreachable")
+            return [account.email]
+
+        with patch.object(manager, "_process_account", side_effect=process_side_effect):
+            results = asyncio.run(manager.afetch_all_emails(max_per_folder=5))
+
+        self.assertEqual(sorted(results), ["u0@x.com", "u2@x.com"])
+        manager.logger.error.assert_called_once()
+
     def test_process_account_skips_missing_client(self):
         """
         _process_account returns an empty list when the account's client
@@ -1,3 +1,4 @@
+import re
 import unittest
 from datetime import datetime
 from unittest.mock import patch
@@ -101,6 +102,117 @@ class TestNLPAnalyzer(unittest.TestCase):
         # So mismatch is expected here with current logic.
         self.assertTrue(has_mismatch)
 
+    def test_analyze_batch_matches_per_email_analyze(self):
+        """The single-pass arena scan must agree with analyze() per email."""
+        bodies = [
+            "Please verify your account within 24 hours!!!",
+            "Your access is LOCKED. URGENT ACTION NEEDED NOW!",
+            "Lunch tomorrow?",
+            "",
+            "The IRS has issued a final notice. Free gift inside.",
+        ]
+        emails = [
+            EmailData(
+                message_id=str(i),
+                subject=f"Security alert {i}" if i % 2 else "Hello",
+                sender="ceo@paypal.com" if i % 3 else "someone@example.com",
+                recipient="user@example.com",
+                date=datetime.now(),
+                body_text=bodies[i % len(bodies)],
+                body_html="",
+                headers={},
+                attachments=[],
+                raw_email=None,
+                account_email="user@example.com",
+                folder="Inbox",
+            )
+            for i in range(NLPThreatAnalyzer.BATCH_ARENA_MIN_SIZE + 4)
+        ]
+
+        batch_results = self.analyzer.analyze_batch(emails)
+
+        self.assertEqual(
+            batch_results, [self.analyzer.analyze(email) for email in emails]
+        )
+
+    def test_indicator_strings_shared_between_results(self):
+        """Identical indicators across emails reuse one string object."""
+        email = EmailData(
+            message_id="4",
+            subject="Security alert",
+            sender="ceo@random-domain.com",
+            recipient="user@example.com",
+            date=datetime.now(),
+            body_text="I am the CEO. Please verify your account.",
+            body_html="",
+            headers={},
+            attachments=[],
+            raw_email=None,
+            account_email="user@example.com",
+            folder="Inbox",
+        )
+
+        first = self.analyzer.analyze(email)
+        second = self.analyzer.analyze(email)
+
+        self.assertIn(
+            "Security alert (1 occurrences)", first.social_engineering_indicators
+        )
+        for a, b in zip(
+            first.social_engineering_indicators + first.authority_impersonation,
+            second.social_engineering_indicators + second.authority_impersonation,
+        ):
+            self.assertIs(a, b)
+
+    def test_blank_email_skips_pattern_scan(self):
+        """Whitespace-only subject/body returns a clean result without scanning."""
+        email = EmailData(
+            message_id="5",
+            subject="  ",
+            sender="ceo@random-domain.com",
+            recipient="user@example.com",
+            date=datetime.now(),
+            body_text="",
+            body_html="<p>html only</p>",
+            headers={},
+            attachments=[],
+            raw_email=None,
+            account_email="user@example.com",
+            folder="Inbox",
+        )
+
+        with patch.object(self.analyzer, "_scan_text_patterns") as mock_scan:
+            result = self.analyzer.analyze(email)
+
+        mock_scan.assert_not_called()
+        self.assertEqual(result.threat_score, 0.0)
+        self.assertEqual(result.social_engineering_indicators, [])
+
+    def test_authority_claim_backed_by_sender_domain(self):
+        """A claimed entity contained in the sender domain is not a mismatch."""
+        score, indicators = self.analyzer._detect_authority_impersonation(
+            "PayPal Service <service@mail.paypal-bank.com>",
+            {"Authority entity mention": ["paypal", "bank"]},
+        )
+        self.assertEqual(indicators, ["Authority entity mention"])
+        self.assertEqual(score, 1.0)
+
+        _, indicators = self.analyzer._detect_authority_impersonation(
+            "service@mail.paypal.com",
+            {"Authority entity mention": ["paypal", "irs"]},
+        )
+        self.assertEqual(indicators, ["Authority entity mention (domain mismatch)"])
+
+    def test_authority_patterns_match_their_declared_terms(self):
+        """Patterns derived from AUTHORITY_TERM_GROUPS match every literal term."""
+        for pattern, (terms, _) in zip(
+            NLPThreatAnalyzer.AUTHORITY_PATTERNS,
+            NLPThreatAnalyzer.AUTHORITY_TERM_GROUPS,
+        ):
+            for term in terms:
+                with self.subTest(term=term):
+                    self.assertIsNotNone(re.fullmatch(pattern[0], term))
+
     def test_ml_model_disabled_skips_initialize(self):
         """When enable_ml_model=False, _initialize_model() must not be called."""
         config = MockConfig()
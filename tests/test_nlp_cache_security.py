@@ -1,35 +1,29 @@
-import hashlib
-import time
 import unittest
 
-from src.modules.nlp_analyzer import NLPThreatAnalyzer
+from src.modules.nlp_analyzer import _CACHE_KEY_HASH, NLPThreatAnalyzer
 from src.utils.caching import TTLCache
-
-
-# Mock Config
-class MockConfig:
-    def __init__(self):
-        self.check_social_engineering = True
-        self.check_urgency_markers = True
-        self.check_authority_impersonation = True
-        self.check_psychological_triggers = True
-        self.nlp_threshold = 0.5
-        self.nlp_model = "distilbert-base-uncased"
-        self.nlp_model_revision = "main"
-        self.enable_ml_model = True
+from tests._mock_config import MockConfig
 
 
 class TestNLPCacheSecurity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Build the analyzer once; per-test state is reset in setUp below.
+        cls.config = MockConfig()
+        cls._shared_analyzer = NLPThreatAnalyzer(cls.config)
+        cls._shared_cache = cls._shared_analyzer._cache
+
     def setUp(self):
-        self.config = MockConfig()
-        self.analyzer = NLPThreatAnalyzer(self.config)
+        self.analyzer = self._shared_analyzer
 
         # Mock the internal implementation to avoid needing torch
         # We replace the method on the instance
         self.call_count = 0
         self.analyzer._analyze_core_impl = self._mock_analyze_core_impl
 
-        # Clear the TTLCache so each test starts with an empty cache
+        # Restore the shared TTLCache (some tests swap it out) and clear it
+        # so each test starts with an empty cache
+        self.analyzer._cache = self._shared_cache
         self.analyzer._cache.clear()
 
     def _mock_analyze_core_impl(self, text):
@@ -59,38 +53,53 @@ class TestNLPCacheSecurity(unittest.TestCase):
         self.assertEqual(len(keys), 1)
 
         key = keys[0]
-        # SHA256 hexdigest is 64 chars
+        # SHA-256 / BLAKE3 hexdigest is 64 chars
         self.assertEqual(len(key), 64)
 
         # Verify key is indeed the hash of the text
-        expected_hash = hashlib.sha256(text.encode()).hexdigest()
+        expected_hash = _CACHE_KEY_HASH(text.encode()).hexdigest()
         self.assertEqual(key, expected_hash)
 
         # Verify text is NOT in keys
         self.assertNotIn(text, keys)
 
+    def test_cache_key_hashes_truncated_prefix_only(self):
+        """Long texts are keyed on their first 4096 chars, not the full body."""
+        prefix = "B" * NLPThreatAnalyzer.TRANSFORMER_MAX_CHARS
+        self.analyzer.analyze_with_transformer(prefix + "tail one" * 1000)
+        self.analyzer.analyze_with_transformer(prefix + "tail two" * 1000)
+
+        self.assertEqual(self.call_count, 1)
+        self.assertEqual(
+            list(self.analyzer._cache.keys()),
+            [_CACHE_KEY_HASH(prefix.encode()).hexdigest()],
+        )
+
     def test_cache_eviction(self):
-        # Fill cache to max capacity (512 entries)
-        for i in range(512):
-            self.analyzer.analyze_with_transformer(f"Email {i}")
+        # Precompute every key once; the cache only ever sees hashes
+        expected = [
+            _CACHE_KEY_HASH(f"Email {i}".encode()).hexdigest() for i in range(513)
+        ]
+        result = {"threat_probability": 0.1, "confidence": 0.9}
+
+        # Fill cache to max capacity (512 entries) in one bulk insert
+        self.analyzer._cache.put_many((key, result) for key in expected[:512])
 
         self.assertEqual(len(self.analyzer._cache), 512)
-        self.assertEqual(self.call_count, 512)
 
-        # Add one more — oldest entry (Email 0) must be evicted
+        # Add one more through the analyzer — oldest entry (Email 0) must be evicted
         self.analyzer.analyze_with_transformer("Email 512")
+        self.assertEqual(self.call_count, 1)
 
         self.assertEqual(
             len(self.analyzer._cache), 512, "Cache size should remain at max_size"
         )
 
         # Verify oldest (Email 0) is gone
-        hash0 = hashlib.sha256(b"Email 0").hexdigest()
-        self.assertNotIn(hash0, self.analyzer._cache)
+        self.assertNotIn(expected[0], self.analyzer._cache)
 
         # Verify newest is present
-        hash512 = hashlib.sha256(b"Email 512").hexdigest()
-        self.assertIn(hash512, self.analyzer._cache)
+        self.assertIn(expected[512], self.analyzer._cache)
 
     def test_lru_behavior(self):
         # Add 3 items
@@ -104,17 +113,20 @@ class TestNLPCacheSecurity(unittest.TestCase):
         # Verify order (in Python 3.7+ dicts preserve insertion order)
         # Re-inserting (pop + set) moves to end
         keys = list(self.analyzer._cache.keys())
-        hash1 = hashlib.sha256(b"Item 1").hexdigest()
+        hash1 = _CACHE_KEY_HASH(b"Item 1").hexdigest()
         self.assertEqual(keys[-1], hash1, "Item 1 should be last (most recent)")
 
     def test_ttl_eviction(self):
         """Entries older than TTL must be evicted on next access (lazy TTL)."""
-        # Use a cache with a very short TTL so the test doesn't have to wait long
-        short_ttl_cache = TTLCache(max_size=512, ttl_seconds=1)
+        # Drive expiry with a fake nanosecond clock instead of sleeping
+        self._now = 0
+        short_ttl_cache = TTLCache(
+            max_size=512, ttl_seconds=1, time_func=lambda: self._now
+        )
         self.analyzer._cache = short_ttl_cache
 
         text = "TTL test email"
-        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        text_hash = _CACHE_KEY_HASH(text.encode()).hexdigest()
 
         # Populate the cache
         self.analyzer.analyze_with_transformer(text)
@@ -123,8 +135,8 @@ class TestNLPCacheSecurity(unittest.TestCase):
             "Entry should be present before TTL expires",
         )
 
-        # Wait for TTL to expire
-        time.sleep(1.1)
+        # Advance the clock past the TTL
+        self._now += 1_100_000_000
 
         # get() should now return None (lazy expiration) and remove the entry
         result = self.analyzer._cache.get(text_hash)
@@ -1,20 +1,21 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from src.modules.nlp_analyzer import NLPThreatAnalyzer
+from tests._mock_config import MockConfig
 
 
-# Mock config
-class MockConfig:
-    def __init__(self):
-        self.check_social_engineering = True
-        self.check_urgency_markers = True
-        self.check_authority_impersonation = True
-        self.check_psychological_triggers = True
-        self.nlp_threshold = 0.5
-        self.nlp_model = "distilbert-base-uncased"
-        self.nlp_model_revision = "main"
-        self.enable_ml_model = True
+class _Stub:
+    """Callable stand-in that records calls in a plain list (cheaper than MagicMock)."""
+
+    def __init__(self, return_value=None):
+        self.calls = []
+        self.return_value = return_value
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
 
 
 class TestNLPOptimization(unittest.TestCase):
@@ -22,9 +23,9 @@ class TestNLPOptimization(unittest.TestCase):
         self.config = MockConfig()
         self.analyzer = NLPThreatAnalyzer(self.config)
 
-        # Mock model and tokenizer
-        self.analyzer.model = MagicMock()
-        self.analyzer.tokenizer = MagicMock()
+        # Stub model and tokenizer
+        self.analyzer.model = _Stub(return_value=SimpleNamespace(logits=None))
+        self.analyzer.tokenizer = _Stub(return_value={"input_ids": [1]})
 
         # Ensure device is set to avoid attribute errors if code accesses it
         self.analyzer.device = "cpu"
@@ -35,23 +36,12 @@ class TestNLPOptimization(unittest.TestCase):
         # Create text much longer than 4096 chars
         long_text = "A" * 10000
 
-        # Setup tokenizer mock to return something valid
-        self.analyzer.tokenizer.return_value = {"input_ids": [1]}
-        # Mock model output
-        mock_output = MagicMock()
-        mock_output.logits = MagicMock()
-        self.analyzer.model.return_value = mock_output
-
-        # We need to mock torch.softmax and torch.no_grad
-        mock_torch.softmax.return_value = MagicMock()
-        mock_torch.softmax.return_value.__getitem__.return_value = [0.1]  # threat prob
-
         # Action
         self.analyzer.analyze_with_transformer(long_text)
 
         # Verify
         # The tokenizer should be called with truncated text (4096 chars)
-        args, kwargs = self.analyzer.tokenizer.call_args
+        args, kwargs = self.analyzer.tokenizer.calls[-1]
         text_arg = args[0]
 
         self.assertEqual(len(text_arg), 4096)
@@ -59,13 +49,6 @@ class TestNLPOptimization(unittest.TestCase):
 
     @patch("src.modules.nlp_analyzer.torch")
     def test_caching_behavior(self, mock_torch):
-        # Setup tokenizer to count calls
-        self.analyzer.tokenizer.return_value = {"input_ids": [1]}
-        mock_output = MagicMock()
-        mock_output.logits = MagicMock()
-        self.analyzer.model.return_value = mock_output
-        mock_torch.softmax.return_value.__getitem__.return_value = [0.1]
-
         text1 = "Short text"
         text2 = "Short text"  # Identical
 
@@ -74,18 +57,11 @@ class TestNLPOptimization(unittest.TestCase):
         self.analyzer.analyze_with_transformer(text2)
 
         # Verify
-        # Tokenizer should be called only once due to LRU cache on _analyze_with_transformer_core
-        self.assertEqual(self.analyzer.tokenizer.call_count, 1)
+        # Tokenizer should be called only once due to the TTL cache in analyze_with_transformer
+        self.assertEqual(len(self.analyzer.tokenizer.calls), 1)
 
     @patch("src.modules.nlp_analyzer.torch")
     def test_caching_with_long_text_truncation(self, mock_torch):
-        # Setup
-        self.analyzer.tokenizer.return_value = {"input_ids": [1]}
-        mock_output = MagicMock()
-        mock_output.logits = MagicMock()
-        self.analyzer.model.return_value = mock_output
-        mock_torch.softmax.return_value.__getitem__.return_value = [0.1]
-
         # Construct two texts that differ ONLY after the 4096 char mark
         # They should both be truncated to the same string, thus hitting the cache
         long_text1 = "A" * 5000 + "1"
@@ -97,12 +73,37 @@ class TestNLPOptimization(unittest.TestCase):
 
         # Verify
         # Tokenizer call count should be 1 because truncation makes them identical
-        self.assertEqual(self.analyzer.tokenizer.call_count, 1)
+        self.assertEqual(len(self.analyzer.tokenizer.calls), 1)
 
         # Arguments should be truncated
-        args, kwargs = self.analyzer.tokenizer.call_args
+        args, kwargs = self.analyzer.tokenizer.calls[-1]
         self.assertEqual(len(args[0]), 4096)
 
+    @patch("src.modules.nlp_analyzer.torch")
+    def test_batch_caching_behavior(self, mock_torch):
+        # Identical texts in one batch share a single tokenization
+        self.analyzer.analyze_with_transformer_batch(["Short text", "Short text"])
+        self.assertEqual(len(self.analyzer.tokenizer.calls), 1)
+        args, kwargs = self.analyzer.tokenizer.calls[-1]
+        self.assertEqual(args[0], ["Short text"])
+        self.assertTrue(kwargs["padding"])
+
+    @patch("src.modules.nlp_analyzer.torch")
+    def test_batch_different_texts_share_one_forward_pass(self, mock_torch):
+        input_ids = SimpleNamespace(to=lambda device: "batched_ids")
+        self.analyzer.tokenizer = _Stub(return_value={"input_ids": input_ids})
+        mock_torch.softmax.return_value = []
+
+        self.analyzer.analyze_with_transformer_batch(["first text", "second text"])
+
+        # Both misses are tokenized together, padded to one batch of size 2
+        self.assertEqual(len(self.analyzer.tokenizer.calls), 1)
+        args, kwargs = self.analyzer.tokenizer.calls[-1]
+        self.assertEqual(args[0], ["first text", "second text"])
+        self.assertEqual(
+            self.analyzer.model.calls, [((), {"input_ids": "batched_ids"})]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,14 +4,14 @@ Unit tests for NLPThreatAnalyzer.analyze_with_transformer and _analyze_core_impl
 Tests cover:
   - analyze_with_transformer: truncation to 4096 characters, cache hit, cache miss + store
   - _analyze_core_impl: missing model/tokenizer/torch, happy path (mocking torch), and exception handling
+  - analyze_with_transformer_batch / _analyze_core_batch_impl: cache split, dedupe, padded batch
 """
 
 import functools
-import hashlib
 import unittest
 from unittest.mock import MagicMock, patch
 
-from src.modules.nlp_analyzer import NLPThreatAnalyzer
+from src.modules.nlp_analyzer import _CACHE_KEY_HASH, NLPThreatAnalyzer
 
 
 class MockConfig:
@@ -64,7 +64,7 @@ class TestAnalyzeWithTransformer(unittest.TestCase):
         self.analyzer._analyze_core_impl.assert_called_once_with(truncated_text)
         self.assertEqual(result, {"threat_probability": 0.9})
 
-        text_hash = hashlib.sha256(truncated_text.encode()).hexdigest()
+        text_hash = _CACHE_KEY_HASH(truncated_text.encode()).hexdigest()
         self.analyzer._cache.get.assert_called_once_with(text_hash)
         self.analyzer._cache.put.assert_called_once_with(
             text_hash, {"threat_probability": 0.9}
@@ -83,10 +83,94 @@ class TestAnalyzeWithTransformer(unittest.TestCase):
         self.analyzer._analyze_core_impl.assert_not_called()
         self.assertEqual(result, {"threat_probability": 0.1})
 
-        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        text_hash = _CACHE_KEY_HASH(text.encode()).hexdigest()
         self.analyzer._cache.get.assert_called_once_with(text_hash)
         self.analyzer._cache.put.assert_not_called()
 
+    def test_analyze_with_transformer_skips_blank_text(self):
+        """Empty or whitespace-only text never reaches the cache or model."""
+        self.analyzer._cache = MagicMock()
+        self.analyzer._analyze_core_impl = MagicMock()
+
+        for text in ("", "   \n\t "):
+            result = self.analyzer.analyze_with_transformer(text)
+            self.assertIn("error", result)
+
+        self.analyzer._analyze_core_impl.assert_not_called()
+        self.analyzer._cache.get.assert_not_called()
+
+
+class TestAnalyzeWithTransformerBatch(unittest.TestCase):
+    def setUp(self):
+        self.config = MockConfig()
+        self.analyzer = NLPThreatAnalyzer(self.config)
+
+    def test_batch_serves_hits_from_cache_and_dedupes_misses(self):
+        """Cached texts skip the model; repeated misses are analyzed once."""
+        cached_hash = _CACHE_KEY_HASH(b"cached").hexdigest()
+        self.analyzer._cache.put(cached_hash, {"threat_probability": 0.1})
+        self.analyzer._analyze_core_batch_impl = MagicMock(
+            return_value=[{"threat_probability": 0.9}, {"threat_probability": 0.2}]
+        )
+
+        results = self.analyzer.analyze_with_transformer_batch(
+            ["cached", "A" * 5000, "other", "A" * 5000]
+        )
+
+        self.analyzer._analyze_core_batch_impl.assert_called_once_with(
+            ["A" * 4096, "other"]
+        )
+        self.assertEqual(
+            results,
+            [
+                {"threat_probability": 0.1},
+                {"threat_probability": 0.9},
+                {"threat_probability": 0.2},
+                {"threat_probability": 0.9},
+            ],
+        )
+        # Misses are cached for the single-text path too
+        self.analyzer._analyze_core_impl = MagicMock()
+        self.assertEqual(
+            self.analyzer.analyze_with_transformer("other"),
+            {"threat_probability": 0.2},
+        )
+        self.analyzer._analyze_core_impl.assert_not_called()
+
+    @patch("src.modules.nlp_analyzer.torch")
+    def test_batch_core_runs_one_padded_forward_pass(self, mock_torch):
+        """All texts are tokenized together and mapped back row by row."""
+        self.analyzer.model = MagicMock()
+        self.analyzer.tokenizer = MagicMock()
+        self.analyzer.device = "mock_device"
+
+        mock_input_val = MagicMock()
+        mock_input_val.to.return_value = "moved_input_ids"
+        self.analyzer.tokenizer.return_value = {"input_ids": mock_input_val}
+        self.analyzer.model.return_value = MagicMock(logits="mock_logits")
+        mock_torch.softmax.return_value = [
+            [DummyProb(0.8), DummyProb(0.2)],
+            [DummyProb(0.3), DummyProb(0.7)],
+        ]
+
+        results = self.analyzer._analyze_core_batch_impl(["one", "two"])
+
+        self.analyzer.tokenizer.assert_called_once_with(
+            ["one", "two"],
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=512,
+        )
+        self.analyzer.model.assert_called_once_with(input_ids="moved_input_ids")
+        self.assertEqual(
+            results,
+            [
+                {"threat_probability": 0.8, "confidence": 0.8},
+                {"threat_probability": 0.3, "confidence": 0.7},
+            ],
+        )
+
 
 class TestAnalyzeCoreImpl(unittest.TestCase):
     def setUp(self):
@@ -20,6 +20,24 @@ from src.utils.pattern_compiler import (
     compile_patterns,
 )
 
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+# Compiled patterns are immutable, so read-only tests share one module-scoped
+# instance instead of recompiling the same alternation per test.
+
+
+@pytest.fixture(scope="module")
+def foo_bar_pattern():
+    return compile_patterns([r"\bfoo\b", r"\bbar\b"])
+
+
+@pytest.fixture(scope="module")
+def foo_bar_named():
+    return compile_named_group_pattern([r"\bfoo\b", r"\bbar\b"])
+
+
 # ---------------------------------------------------------------------------
 # check_redos_safety
 # ---------------------------------------------------------------------------
@@ -53,6 +71,23 @@ class TestCheckRedosSafety:
         with pytest.raises(ValueError, match="Potential ReDoS"):
             check_redos_safety([bad_pattern])
 
+    @pytest.mark.parametrize(
+        "bad_pattern",
+        [r"(\w+\s*)+", r"(?:\d+)*", r"(x+){2,}", r"(x+){,}"],
+    )
+    def test_nested_quantifier_shapes_raise(self, bad_pattern):
+        """Repeated groups ending in an unbounded quantifier are rejected."""
+        with pytest.raises(ValueError, match="Potential ReDoS"):
+            check_redos_safety([bad_pattern])
+
+    def test_bounded_repeat_of_quantified_group_passes(self):
+        """A brace quantifier with an upper bound cannot backtrack without limit."""
+        check_redos_safety([r"(\w+){2}", r"(x+){0,1}", r"(\d+){2,4}"])
+
+    def test_escaped_quantifier_inside_group_passes(self):
+        """A literal '+' inside a repeated group is not a nested quantifier."""
+        check_redos_safety([r"(a\+)+", r"(\d{3}-)?\d{4}"])  # must not raise
+
     def test_redos_mixed_with_safe_still_raises(self):
         """If any one pattern is unsafe the whole call should raise."""
         patterns = [r"\b(free|bonus)\b", r"(\w+)*"]
@@ -66,8 +101,8 @@ class TestCheckRedosSafety:
 
 
 class TestCompilePatterns:
-    def test_matches_any_pattern(self):
-        pat = compile_patterns([r"\bfoo\b", r"\bbar\b"])
+    def test_matches_any_pattern(self, foo_bar_pattern):
+        pat = foo_bar_pattern
         assert pat.search("I like foo here")
         assert pat.search("bar is nice")
         assert not pat.search("neither of the two")
@@ -110,9 +145,14 @@ class TestCompilePatterns:
         pat = compile_patterns([r"(\w+)*"], validate_redos=False)
         assert isinstance(pat, re.Pattern)
 
-    def test_returns_compiled_pattern(self):
-        result = compile_patterns([r"\btest\b"])
-        assert isinstance(result, re.Pattern)
+    def test_returns_compiled_pattern(self, foo_bar_pattern):
+        assert isinstance(foo_bar_pattern, re.Pattern)
+
+    def test_repeated_calls_reuse_compiled_pattern(self):
+        """Equal pattern lists (list or tuple) share one compiled object."""
+        first = compile_patterns([r"\bcached\b", r"\bpattern\b"])
+        second = compile_patterns((r"\bcached\b", r"\bpattern\b"))
+        assert first is second
 
 
 # ---------------------------------------------------------------------------
@@ -121,14 +161,14 @@ class TestCompilePatterns:
 
 
 class TestCompileNamedGroupPattern:
-    def test_returns_pattern_and_map(self):
-        pat, group_map = compile_named_group_pattern([r"\bfoo\b", r"\bbar\b"])
+    def test_returns_pattern_and_map(self, foo_bar_named):
+        pat, group_map = foo_bar_named
         assert isinstance(pat, re.Pattern)
         assert isinstance(group_map, dict)
         assert len(group_map) == 2
 
-    def test_default_group_naming(self):
-        _, group_map = compile_named_group_pattern([r"\bfoo\b", r"\bbar\b"])
+    def test_default_group_naming(self, foo_bar_named):
+        _, group_map = foo_bar_named
         assert "p_0" in group_map
         assert "p_1" in group_map
 
@@ -186,3 +226,10 @@ class TestCompileNamedGroupPattern:
         m = pat.search("You are the winner")
         assert m is not None
         assert m.lastgroup == "spam_kw_1"
+
+    def test_cached_group_map_is_not_shared(self):
+        """Mutating a returned group map must not leak into later calls."""
+        _, group_map = compile_named_group_pattern([r"\bshared\b"])
+        group_map["p_0"] = "tampered"
+        _, fresh_map = compile_named_group_pattern([r"\bshared\b"])
+        assert fresh_map == {"p_0": r"\bshared\b"}
@@ -63,9 +63,14 @@ class TestSanitization(unittest.TestCase):
 
     def test_newline_sanitization(self):
         """Test that newlines are escaped."""
-        self.assertEqual(sanitize_for_logging("Line 1\nLine 2"), "Line 1\\nLine 2")
-        self.assertEqual(sanitize_for_logging("Line 1\rLine 2"), "Line 1\\rLine 2")
-        self.assertEqual(sanitize_for_logging("Line 1\r\nLine 2"), "Line 1\\r\\nLine 2")
+        cases = [
+            ("Line 1\nLine 2", "Line 1\\nLine 2"),
+            ("Line 1\rLine 2", "Line 1\\rLine 2"),
+            ("Line 1\r\nLine 2", "Line 1\\r\\nLine 2"),
+        ]
+        for raw, expected in cases:
+            with self.subTest(raw=raw):
+                self.assertEqual(sanitize_for_logging(raw), expected)
 
     def test_control_character_sanitization(self):
         """Test that control characters are removed."""
@@ -108,6 +113,23 @@ class TestSanitization(unittest.TestCase):
         # Negative max_length
         self.assertEqual(sanitize_for_logging(text, max_length=-1), "...")
 
+    def test_large_input_truncation(self):
+        """Oversized input is truncated to max_length plus the ellipsis."""
+        text = "A" * 2000 + "\n" * 2000
+        sanitized = sanitize_for_logging(text)
+        self.assertEqual(sanitized, "A" * 255 + "...")
+
+    def test_large_input_with_expansion(self):
+        """CR/LF expand to two chars each; truncation counts output chars."""
+        self.assertEqual(
+            sanitize_for_logging("\n" * 100, max_length=10), "\\n" * 5 + "..."
+        )
+
+    def test_large_input_with_removed_padding(self):
+        """Content hidden behind zero-width padding is still logged."""
+        text = "\u200b" * 5000 + "visible"
+        self.assertEqual(sanitize_for_logging(text, max_length=10), "visible")
+
 
 if __name__ == "__main__":
     unittest.main()
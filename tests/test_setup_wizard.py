@@ -1,9 +1,11 @@
+import contextlib
+import io
 import os
 import subprocess  # nosec B404
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import patch
 
 from src.utils.setup_wizard import (
     WizardSkipped,
@@ -16,8 +18,8 @@ from src.utils.setup_wizard import (
 
 class TestSetupWizard(unittest.TestCase):
 
-    def setUp(self):
-        self.example_content = """
+    # Read-only template shared by every test (built once, not per setUp)
+    example_content = """
 # Email Security Pipeline Configuration
 GMAIL_ENABLED=false
 GMAIL_EMAIL=test@gmail.com
@@ -60,15 +62,23 @@ OUTLOOK_APP_PASSWORD=password
         self.assertFalse(_is_valid_email("user..name@domain.com"))  # Consecutive dots
 
     def _setup_full_mock_dependencies(self):
+        # Template reads and config writes go through real StringIO objects:
+        # mock_open() and a MagicMock write handle build a fresh mock tree per
+        # test, which dominated the cost of these tests. Writes land in
+        # self.written_buffer so tests read the file body with one getvalue().
+        self.written_buffer = io.StringIO()
+        mock_write_handle = self.written_buffer
+
         patcher_exists = patch("pathlib.Path.exists", return_value=True)
         patcher_open = patch(
-            "builtins.open", new_callable=mock_open, read_data=self.example_content
+            "builtins.open",
+            side_effect=lambda *args, **kwargs: io.StringIO(self.example_content),
         )
         patcher_os_open = patch("os.open", return_value=123)
         patcher_os_fchmod = patch("os.fchmod", create=True)
-
-        mock_write_handle = MagicMock()
-        patcher_os_fdopen = patch("os.fdopen")
+        patcher_os_fdopen = patch(
+            "os.fdopen", return_value=contextlib.nullcontext(mock_write_handle)
+        )
 
         patcher_getpass = patch("getpass.getpass")
         patcher_input = patch("builtins.input")
@@ -85,8 +95,6 @@ OUTLOOK_APP_PASSWORD=password
         mock_input = patcher_input.start()
         mock_imap_conn = patcher_imap_conn.start()
 
-        mock_os_fdopen.return_value.__enter__.return_value = mock_write_handle
-
         # Add cleanups
         self.addCleanup(patcher_exists.stop)
         self.addCleanup(patcher_open.stop)
@@ -146,9 +154,7 @@ OUTLOOK_APP_PASSWORD=password
             0o600,
         )
 
-        written_content = "".join(
-            call.args[0] for call in mock_write_handle.write.call_args_list
-        )
+        written_content = self.written_buffer.getvalue()
         self.assertIn("GMAIL_ENABLED=true", written_content)
         self.assertIn("GMAIL_EMAIL=myuser@gmail.com", written_content)
         self.assertIn("GMAIL_APP_PASSWORD=mypassword", written_content)
@@ -179,9 +185,7 @@ OUTLOOK_APP_PASSWORD=password
         result = run_setup_wizard(config_file=".env", template_file=".env.example")
         self.assertTrue(result)
 
-        written_content = "".join(
-            call.args[0] for call in mock_write_handle.write.call_args_list
-        )
+        written_content = self.written_buffer.getvalue()
         self.assertIn("PROTON_ENABLED=true", written_content)
         self.assertIn("PROTON_EMAIL=myuser@pm.me", written_content)
         self.assertIn("PROTON_APP_PASSWORD=protonpass", written_content)
@@ -210,9 +214,7 @@ OUTLOOK_APP_PASSWORD=password
         result = run_setup_wizard(config_file=".env", template_file=".env.example")
         self.assertTrue(result)
 
-        written_content = "".join(
-            call.args[0] for call in mock_write_handle.write.call_args_list
-        )
+        written_content = self.written_buffer.getvalue()
         self.assertIn("GMAIL_EMAIL=valid@gmail.com", written_content)
 
     @patch("builtins.input")
@@ -257,9 +259,7 @@ OUTLOOK_APP_PASSWORD=password
         result = run_setup_wizard(config_file=".env", template_file=".env.example")
         self.assertTrue(result)
 
-        written_content = "".join(
-            call.args[0] for call in mock_write_handle.write.call_args_list
-        )
+        written_content = self.written_buffer.getvalue()
         self.assertIn("GMAIL_EMAIL=good@gmail.com", written_content)
         self.assertIn("GMAIL_APP_PASSWORD=goodpassword", written_content)
 
@@ -1,7 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
 
 import pytest
 
+from src.modules import spam_analyzer as spam_analyzer_module
 from src.modules.email_ingestion import EmailData
 from src.modules.spam_analyzer import SpamAnalyzer
 
@@ -101,6 +104,72 @@ def test_spam_email_analysis(spam_analyzer, spam_email):
     assert "spam keyword" in indicators_str
 
 
+class EarlyExitConfig(MockConfig):
+    spam_threshold = 2.0
+    spam_early_exit = True
+
+
+def test_early_exit_skips_content_stages_for_clear_spam(spam_email):
+    # Subject (4.5) + headers (2.5) already reach the "high" tier (>= 4.0)
+    result = SpamAnalyzer(EarlyExitConfig()).analyze(spam_email)
+
+    assert result.risk_level == "high"
+    assert result.suspicious_urls == []
+    assert not any("spam keyword matches" in i for i in result.indicators)
+
+
+def test_early_exit_is_opt_in(spam_analyzer, spam_email):
+    # The default config runs every stage, so body findings are reported
+    result = spam_analyzer.analyze(spam_email)
+
+    assert result.suspicious_urls
+    assert any("spam keyword matches" in i for i in result.indicators)
+
+
+def test_analyze_batch_matches_per_email_analysis(
+    spam_analyzer, clean_email, spam_email
+):
+    bodies = [
+        ("viagra pills available now", None),
+        ("oil spills and surprized neighbours", ""),
+        ("", "<p>FREE MONEY, act now</p>"),
+        ("nothing to see here", "<b>winner</b>"),
+    ]
+    emails = [clean_email, spam_email]
+    for text, html in bodies:
+        emails.append(replace(clean_email, body_text=text, body_html=html))
+    emails *= 2
+    assert len(emails) >= SpamAnalyzer.BATCH_ARENA_MIN_SIZE
+
+    assert spam_analyzer.analyze_batch(emails) == [
+        spam_analyzer.analyze(email) for email in emails
+    ]
+
+
+def test_analyze_batch_on_executor_matches_serial(
+    spam_analyzer, clean_email, spam_email
+):
+    # More than one chunk, last one partial, to check results keep input order.
+    # A thread pool exercises the same chunking and merge as a process pool
+    # without paying interpreter start-up.
+    emails = [clean_email, spam_email] * (SpamAnalyzer.BATCH_CHUNK_SIZE + 1)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = spam_analyzer.analyze_batch(emails, executor=executor)
+
+    assert results == spam_analyzer.analyze_batch(emails)
+
+
+def test_chunk_task_reuses_analyzer_for_equal_config(clean_email):
+    config = MockConfig()
+
+    spam_analyzer_module._analyze_spam_chunk(config, [clean_email])
+    first = spam_analyzer_module._chunk_analyzer[1]
+    spam_analyzer_module._analyze_spam_chunk(config, [clean_email])
+
+    assert spam_analyzer_module._chunk_analyzer[1] is first
+
+
 def test_spam_keywords_detection(spam_analyzer, clean_email):
     clean_email.body_text = "viagra pills available now"
     result = spam_analyzer.analyze(clean_email)
@@ -115,6 +184,15 @@ def test_spam_keywords_detection(spam_analyzer, clean_email):
     assert found_keyword
 
 
+def test_spam_keywords_require_word_boundaries(spam_analyzer, clean_email):
+    # "pills" and "prize" occur only inside longer words; the Aho-Corasick
+    # pre-check fires, but the counted matches must respect word boundaries
+    clean_email.body_text = "oil spills and surprized neighbours"
+    result = spam_analyzer.analyze(clean_email)
+
+    assert not any("spam keyword matches" in i for i in result.indicators)
+
+
 def test_excessive_links(spam_analyzer, clean_email):
     links = " ".join([f"http://example{i}.com" for i in range(15)])
     clean_email.body_text = links
@@ -140,6 +218,19 @@ def test_hidden_text(spam_analyzer, clean_email):
     assert found_hidden
 
 
+def test_hidden_text_white_on_white(spam_analyzer, clean_email):
+    clean_email.body_html = (
+        "<span style='color: #fff; background-color: #fff'>hidden</span>"
+    )
+    result = spam_analyzer.analyze(clean_email)
+    assert "Hidden text detected" in result.indicators
+
+    # Styled but visible HTML never reaches the hidden-text regex branch
+    clean_email.body_html = "<p style='color: #333; background: #eee'>hi</p>" * 50
+    result = spam_analyzer.analyze(clean_email)
+    assert "Hidden text detected" not in result.indicators
+
+
 def test_suspicious_urls(spam_analyzer, clean_email):
     clean_email.body_text = "Check this http://bit.ly/suspicious"
     result = spam_analyzer.analyze(clean_email)
@@ -55,9 +55,67 @@ def test_check_urls_correctness(spam_analyzer):
     assert len(suspicious) == 4  # bit.ly (2) + ip (1) + long (1)
 
 
+def test_mixed_case_hosts_still_matched(spam_analyzer):
+    score, suspicious = spam_analyzer._check_urls(["http://BIT.Ly/Promo"])
+    assert score == 0.5
+    assert suspicious == ["http://BIT.Ly/Promo"]
+
+
+def test_duplicate_urls_scanned_once(spam_analyzer):
+    urls = ["http://bit.ly/spam"] * 10_000 + ["http://google.com"] * 5
+
+    score, suspicious = spam_analyzer._check_urls(urls)
+
+    assert score == 5000.0  # 0.5 * 10k duplicates
+    assert suspicious == ["http://bit.ly/spam"] * 10_000
+    assert len(spam_analyzer.url_cache) == 2  # one entry per unique URL
+
+
+def test_repeated_url_list_served_from_list_cache(spam_analyzer):
+    urls = ["http://bit.ly/a", "http://google.com", "http://bit.ly/a"]
+    first = spam_analyzer._check_urls(urls)
+
+    # Per-URL scoring must not run again for the identical list
+    spam_analyzer.url_cache.clear()
+    score, suspicious = spam_analyzer._check_urls(list(urls))
+
+    assert (score, suspicious) == first == (1.0, ["http://bit.ly/a"] * 2)
+    assert len(spam_analyzer.url_cache) == 0
+
+    # Callers get their own list back
+    suspicious.append("mutated")
+    assert spam_analyzer._check_urls(urls)[1] == ["http://bit.ly/a"] * 2
+
+
+def test_url_lists_with_nul_are_not_memoized(spam_analyzer):
+    # ["a\0b"] and ["a", "b"] join to the same string; neither may be
+    # served the other's cached result
+    spam_analyzer._check_urls(["http://bit.ly/x", "http://google.com"])
+    score, suspicious = spam_analyzer._check_urls(
+        ["http://bit.ly/x\x00http://google.com"]
+    )
+
+    assert len(spam_analyzer.url_list_cache) == 1
+    assert suspicious == ["http://bit.ly/x\x00http://google.com"]
+
+
 def test_shorteners_still_caught(spam_analyzer):
     # Verify shorteners removed from SHORTENER_PATTERN are still caught by COMBINED
     urls = ["http://goo.gl/test", "http://tinyurl.com/abc"]
     score, suspicious = spam_analyzer._check_urls(urls)
     assert score == 1.0  # 0.5 * 2
     assert len(suspicious) == 2
+
+
+def test_instances_share_compiled_state(spam_analyzer):
+    # Patterns and the keyword automaton are built once at class load, so a
+    # new analyzer (e.g. in a worker process) pays no compile cost
+    other = SpamAnalyzer(spam_analyzer.config)
+    for name in (
+        "SPAM_AUTOMATON",
+        "MASTER_SPAM_PATTERN",
+        "COMBINED_SPAM_PATTERN",
+        "COMBINED_URL_PATTERN",
+    ):
+        assert getattr(other, name) is getattr(spam_analyzer, name)
+    assert "SPAM_AUTOMATON" not in vars(other)
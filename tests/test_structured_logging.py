@@ -214,6 +214,19 @@ class TestJSONFormatter(unittest.TestCase):
         # but we can check it matches the format "YYYY-MM-DD"
         self.assertRegex(data["timestamp"], r"^\d{4}-\d{2}-\d{2}$")
 
+    def test_timestamp_matches_stdlib_format_time(self):
+        """Cached timestamps must equal logging.Formatter.formatTime output."""
+        stdlib = logging.Formatter()
+        for created in (1609459200.125, 1609459200.875, 1609459201.5, 1609459200.0):
+            for datefmt in (None, "%Y-%m-%d %H:%M:%S"):
+                with self.subTest(created=created, datefmt=datefmt):
+                    record = self._create_record(created=created)
+                    record.msecs = (created - int(created)) * 1000
+                    self.assertEqual(
+                        self.formatter.formatTime(record, datefmt),
+                        stdlib.formatTime(record, datefmt),
+                    )
+
     def test_empty_message_and_args(self):
         """Test formatting with an empty message and no args."""
         record = self._create_record(msg="")
@@ -1,165 +1,132 @@
+import re
+import sys
+import time
 import unittest
 from io import StringIO
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-from src.utils.ui import Spinner
-
-
-class TestSpinner(unittest.TestCase):
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_success_persist(self, mock_stdout):
-        # We need to mock isatty to be True for Spinner to activate
-        mock_stdout.isatty = MagicMock(return_value=True)
-
-        # Test default persist=True
-        with Spinner("Testing Success"):
-            pass
+import pytest
 
-        output = mock_stdout.getvalue()
-        # Verify checkmark and message are present. We mock isatty() to True above,
-        # so Colors.ENABLED should be True and the spinner should use colored output.
-        self.assertIn("✔ Testing Success", output)
-        self.assertIn("Testing Success", output)
+from src.utils.ui import Spinner
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_success_no_persist(self, mock_stdout):
-        mock_stdout.isatty = MagicMock(return_value=True)
+# (isatty, persist) grid shared by every outcome below
+TTY_PERSIST_MATRIX = [
+    pytest.param(True, True, id="tty-persist"),
+    pytest.param(True, False, id="tty-no-persist"),
+    pytest.param(False, True, id="non-tty-persist"),
+    pytest.param(False, False, id="non-tty-no-persist"),
+]
 
-        # Test persist=False
-        with Spinner("Testing No Persist", persist=False):
-            pass
 
-        output = mock_stdout.getvalue()
-        # Verify checkmark is NOT present
-        self.assertNotIn("✔ Testing No Persist", output)
-        # It should clear the line
-        self.assertIn("\r\033[K", output)
+class FakeTerminal(StringIO):
+    """StringIO whose isatty() reports a fixed terminal mode."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_failure(self, mock_stdout):
-        mock_stdout.isatty = MagicMock(return_value=True)
+    def __init__(self, isatty):
+        super().__init__()
+        self._isatty = isatty
 
-        try:
-            with Spinner("Testing Failure"):
-                raise ValueError("Oops")
-        except ValueError:
-            pass
+    def isatty(self):
+        return self._isatty
 
-        output = mock_stdout.getvalue()
-        # Verify cross is present
-        self.assertIn("✖ Testing Failure", output)
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_non_tty_basic_output(self, mock_stdout):
-        # Simulate a non-TTY environment (e.g., CI logs, redirected output)
-        mock_stdout.isatty = MagicMock(return_value=False)
+@pytest.fixture
+def isatty():
+    """Terminal mode for fake_stdout; parametrize ``isatty`` to override."""
+    return True
 
-        with Spinner("Testing non TTY basic"):
-            # No exception: spinner should complete successfully
-            pass
 
-        output = mock_stdout.getvalue()
-        # Verify that the message itself was printed in non-TTY mode
-        self.assertIn("Testing non TTY basic", output)
-        # In non-TTY mode we should not rely on TTY-specific clear sequences
-        self.assertNotIn("\r\033[K", output)
+@pytest.fixture
+def fake_stdout(isatty):
+    """Patcher that swaps sys.stdout for a FakeTerminal; enter it in the test.
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_success_persist_non_tty(self, mock_stdout):
-        # Non-TTY with default persist=True should still print a success message
-        mock_stdout.isatty = MagicMock(return_value=False)
+    ``with fake_stdout as out:`` yields the buffer. The swap has to happen in
+    the test body: pytest re-installs its capture stream on sys.stdout when
+    the call phase starts, replacing anything set during fixture setup.
+    """
+    return patch.object(sys, "stdout", FakeTerminal(isatty))
 
-        with Spinner("Testing non TTY persist"):
-            pass
 
-        output = mock_stdout.getvalue()
-        # Verify checkmark success line is present even when not in a TTY
-        self.assertIn("✔ Testing non TTY persist", output)
-        self.assertNotIn("\x1b[", output)
+@pytest.mark.parametrize("isatty,persist", TTY_PERSIST_MATRIX)
+class TestSpinnerOutcomes:
+    """Final-line rendering for each outcome across TTY and persist modes."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_success_no_persist_non_tty(self, mock_stdout):
-        # Non-TTY with persist=False should not print a success line
-        mock_stdout.isatty = MagicMock(return_value=False)
+    def _assert_output_mode(self, isatty, output):
+        if isatty:
+            assert "\033[?25l" in output  # CURSOR_HIDE: the TTY spinner ran
+        else:
+            # Non-TTY output (CI logs, redirected output) must carry no escapes
+            assert "\x1b[" not in output
 
-        with Spinner("Testing non TTY no persist", persist=False):
+    def test_success_auto(self, fake_stdout, isatty, persist):
+        with fake_stdout as out, Spinner("Testing Success", persist=persist):
             pass
 
-        output = mock_stdout.getvalue()
-        # Verify checkmark success line is NOT present
-        self.assertNotIn("✔ Testing non TTY no persist", output)
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_failure_non_tty(self, mock_stdout):
-        # Non-TTY failure should still emit a clear failure message
-        mock_stdout.isatty = MagicMock(return_value=False)
-
-        try:
-            with Spinner("Testing non TTY failure"):
+        output = out.getvalue()
+        # The start message is printed in both modes; the checkmark line
+        # only when persist=True
+        assert "Testing Success" in output
+        assert ("✔ Testing Success" in output) is persist
+        if isatty and not persist:
+            # The spinner line is cleared instead
+            assert "\r\033[K" in output
+        self._assert_output_mode(isatty, output)
+
+    def test_failure_auto(self, fake_stdout, isatty, persist):
+        with pytest.raises(ValueError), fake_stdout as out:
+            with Spinner("Testing Failure", persist=persist):
                 raise ValueError("Oops")
-        except ValueError:
-            # Swallow the error so we can assert on the output
-            pass
-
-        output = mock_stdout.getvalue()
-        # Verify failure cross message is present in non-TTY mode
-        self.assertIn("✖ Testing non TTY failure", output)
-        self.assertNotIn("\x1b[", output)
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_custom_success(self, mock_stdout):
-        mock_stdout.isatty = MagicMock(return_value=True)
+        output = out.getvalue()
+        # Failures are always reported, regardless of persist
+        assert "✖ Testing Failure" in output
+        self._assert_output_mode(isatty, output)
 
-        with Spinner("Checking...", persist=False) as s:
+    def test_custom_success(self, fake_stdout, isatty, persist):
+        with fake_stdout as out, Spinner("Checking...", persist=persist) as s:
             s.success("Done!")
 
-        output = mock_stdout.getvalue()
-        # Verify custom success message overrides persist=False
-        self.assertIn("✔ Done!", output)
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_custom_failure(self, mock_stdout):
-        mock_stdout.isatty = MagicMock(return_value=True)
+        output = out.getvalue()
+        # A custom success message overrides persist=False
+        assert "✔ Done!" in output
+        self._assert_output_mode(isatty, output)
 
-        try:
-            with Spinner("Checking...") as s:
+    def test_custom_failure(self, fake_stdout, isatty, persist):
+        with pytest.raises(ValueError), fake_stdout as out:
+            with Spinner("Checking...", persist=persist) as s:
                 s.fail("Failed!")
                 raise ValueError("Oops")
-        except ValueError:
-            pass
 
-        output = mock_stdout.getvalue()
-        # Verify custom failure message is used
-        self.assertIn("✖ Failed!", output)
+        output = out.getvalue()
+        assert "✖ Failed!" in output
+        self._assert_output_mode(isatty, output)
+
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_custom_success_non_tty(self, mock_stdout):
-        mock_stdout.isatty = MagicMock(return_value=False)
+class TestSpinnerTTY:
+    """Spinner behaviour that only shows up on an interactive terminal."""
 
-        with Spinner("Checking...", persist=False) as s:
-            s.success("Custom Done!")
+    def test_spinner_spin_loop_and_elapsed(self, fake_stdout):
+        with fake_stdout as out, Spinner("Testing loop", delay=0.01) as spinner:
+            # Fake the start time so elapsed is > 1.0 in the spin loop
+            spinner.start_time = time.time() - 1.5
+            # Sleep enough to let the thread wake up (0.1s) and run at least one loop
+            time.sleep(0.15)
 
-        output = mock_stdout.getvalue()
-        # Verify custom success message overrides persist=False in non-TTY mode
-        self.assertIn("✔ Custom Done!", output)
-        self.assertNotIn("\x1b[", output)
+        output = out.getvalue()
+        assert re.search(r"\[1\.\d+s\]", output)
+        assert "Press Ctrl+C to stop" in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_custom_failure_non_tty(self, mock_stdout):
-        mock_stdout.isatty = MagicMock(return_value=False)
+    def test_spinner_keyboard_interrupt(self, fake_stdout):
+        with pytest.raises(KeyboardInterrupt), fake_stdout as out:
+            with Spinner("Testing Interrupt"):
+                raise KeyboardInterrupt()
 
-        try:
-            with Spinner("Checking...") as s:
-                s.fail("Custom Failed!")
-                raise ValueError("Oops")
-        except ValueError:
-            pass
+        output = out.getvalue()
+        assert "⚠" in output
+        assert "Cancelled" in output
+        assert "Testing Interrupt" in output
 
-        output = mock_stdout.getvalue()
-        # Verify custom failure message is printed in non-TTY mode
-        self.assertIn("✖ Custom Failed!", output)
-        self.assertNotIn("\x1b[", output)
 
+class TestSpinner(unittest.TestCase):
     @patch("sys.stdout")
     def test_cursor_hide_show_in_tty(self, mock_stdout):
         """Test cursor is hidden and restored when isatty is True."""
@@ -187,40 +154,3 @@ class TestSpinner(unittest.TestCase):
         )
         self.assertNotIn("\033[?25l", writes)
         self.assertNotIn("\033[?25h", writes)
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_spin_loop_and_elapsed(self, mock_stdout):
-        import time
-
-        mock_stdout.isatty = MagicMock(return_value=True)
-
-        with Spinner("Testing loop", delay=0.01) as spinner:
-            # Fake the start time so elapsed is > 1.0 in the spin loop
-            spinner.start_time = time.time() - 1.5
-            # Sleep enough to let the thread wake up (0.1s) and run at least one loop
-            time.sleep(0.15)
-
-        output = mock_stdout.getvalue()
-        self.assertRegex(output, r"\[1\.\d+s\]")
-        self.assertIn("Press Ctrl+C to stop", output)
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_spinner_keyboard_interrupt(self, mock_stdout):
-        mock_stdout.isatty = MagicMock(return_value=True)
-
-        try:
-            with Spinner("Testing Interrupt"):
-                raise KeyboardInterrupt()
-        except KeyboardInterrupt:
-            pass
-
-        output = mock_stdout.getvalue()
-        self.assertIn("⚠", output)
-        self.assertIn("Cancelled", output)
-        self.assertIn("Testing Interrupt", output)
-
-    def test_spinner_color_fallback(self):
-        spinner = Spinner("Test")
-        from src.utils.colors import Colors
-
-        self.assertEqual(spinner._get_color_for_symbol("?"), Colors.WHITE)
@@ -1,7 +1,6 @@
 import unittest
-from unittest.mock import MagicMock, Mock
+from types import SimpleNamespace
 
-from src.utils.config import AlertConfig, Config, EmailAccountConfig
 from src.utils.validators import check_default_credentials
 
 SCENARIOS = [
@@ -92,12 +91,17 @@ SCENARIOS = [
 
 class TestValidators(unittest.TestCase):
     def setUp(self):
-        # Create a mock config
-        self.config = MagicMock(spec=Config)
-        self.config.email_accounts = []
-        self.config.alerts = MagicMock(spec=AlertConfig)
-        self.config.alerts.webhook_enabled = False
-        self.config.alerts.slack_enabled = False
+        # check_default_credentials only reads plain attributes, so a bare
+        # namespace stands in for Config without MagicMock's spec walk
+        self.config = SimpleNamespace(
+            email_accounts=[],
+            alerts=SimpleNamespace(
+                webhook_enabled=False,
+                slack_enabled=False,
+                webhook_url="",
+                slack_webhook="",
+            ),
+        )
 
     def test_check_default_credentials(self):
         for (
@@ -114,8 +118,7 @@ class TestValidators(unittest.TestCase):
             with self.subTest(scenario=name):
                 self.config.email_accounts = (
                     [
-                        Mock(
-                            spec=EmailAccountConfig,
+                        SimpleNamespace(
                             enabled=acc_enabled,
                             email=acc_email,
                             app_password=acc_pw,